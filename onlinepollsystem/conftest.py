@@ -1,51 +1,161 @@
 import os
 import django
-from django.conf import settings
 
 # Configure Django settings before any Django imports
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'onlinepollsystem.settings')
+os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'onlinepollsystem.test_settings')
 django.setup()
 
 import pytest
+from contextlib import contextmanager
+from django.core.cache import cache
+from django.db import connection, transaction
 from django.test import Client
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIClient
 from rest_framework.authtoken.models import Token
 from users.models import User
 
+def pytest_configure(config):
+    config.addinivalue_line(
+        'markers', 'max_queries(n): fail if a block wrapped with the max_queries fixture runs more than n queries'
+    )
+
+SEED_USER = {
+    'username': 'fixtureuser',
+    'email': 'fixture@example.com',
+    'first_name': 'Fixture',
+    'last_name': 'User',
+}
+
+SEED_ADMIN = {
+    'username': 'fixtureadmin',
+    'email': 'fixtureadmin@example.com',
+    'first_name': 'Fixture',
+    'last_name': 'Admin',
+}
+
 @pytest.fixture(scope='session')
-def django_db_setup():
-    """Setup test database"""
-    pass
+def django_db_setup(django_db_setup, django_db_blocker):
+    """Create the test database once and seed data shared by every test"""
+    with django_db_blocker.unblock():
+        if not User.objects.filter(email=SEED_USER['email']).exists():
+            User.objects.create_user(password='testpass123', **SEED_USER)
+        admin = User.objects.filter(email=SEED_ADMIN['email']).first()
+        if admin is None:
+            admin = User.objects.create_superuser(password='testpass123', **SEED_ADMIN)
+        # Seeded here rather than lazily: a session fixture first requested
+        # while class_user's transaction is open would be rolled back with it
+        Token.objects.get_or_create(user=admin)
 
 @pytest.fixture
 def client():
     return Client()
 
-@pytest.fixture
-def api_client():
+@pytest.fixture(scope='module')
+def _module_api_client():
     return APIClient()
 
 @pytest.fixture
-def authenticated_user():
-    """Create a test user and return it"""
-    user = User.objects.create_user(
-        username='testuser',
-        email='test@example.com',
-        first_name='Test',
-        last_name='User',
-        password='testpass123'
-    )
-    return user
+def api_client(_module_api_client):
+    """
+    Return the test module's shared API client. Reusing it keeps the
+    handler's middleware chain loaded between tests. Credentials and
+    cookies are reset after every test; logout() is avoided because it
+    always opens a session in the database, which fails after a test that
+    broke its transaction. Tests that force_authenticate() should build
+    their own client.
+    """
+    yield _module_api_client
+    _module_api_client.credentials()
+    _module_api_client.cookies.clear()
+
+@pytest.fixture(scope='session')
+def authenticated_user(django_db_setup, django_db_blocker):
+    """Return the user seeded once for the whole session"""
+    with django_db_blocker.unblock():
+        return User.objects.get(email=SEED_USER['email'])
+
+@pytest.fixture(scope='session')
+def _auth_token(authenticated_user, django_db_blocker):
+    """Create the seeded user's token once; it is stable for the session"""
+    with django_db_blocker.unblock():
+        token, created = Token.objects.get_or_create(user=authenticated_user)
+        return token.key
+
+@pytest.fixture(scope='session')
+def admin_user(django_db_setup, django_db_blocker):
+    """Return the staff superuser seeded once for the whole session"""
+    with django_db_blocker.unblock():
+        return User.objects.get(email=SEED_ADMIN['email'])
+
+@pytest.fixture(scope='session')
+def admin_token(admin_user, django_db_blocker):
+    """Return the seeded admin's token key"""
+    with django_db_blocker.unblock():
+        return Token.objects.get(user=admin_user).key
+
+@pytest.fixture(scope='class')
+def class_user(django_db_setup, django_db_blocker):
+    """
+    Create a user and token once per test class instead of once per test.
+
+    Yields ``(user_id, token_key)``. The rows live in a transaction that
+    wraps the whole class (each test's own transaction nests inside it as a
+    savepoint) and is rolled back when the class finishes. Tests load their
+    own copy of the user so in-memory changes do not leak between them.
+    Under pytest-xdist, run with ``--dist=loadscope`` so a class stays on
+    one worker and this runs once per class there too.
+    """
+    from tests.factories import UserFactory
+
+    with django_db_blocker.unblock(), transaction.atomic():
+        user = UserFactory()
+        token = Token.objects.create(user=user)
+        yield user.pk, token.key
+        transaction.set_rollback(True)
 
 @pytest.fixture
-def authenticated_client(authenticated_user):
+def authenticated_client(authenticated_user, _auth_token):
     """Return an authenticated API client"""
     client = APIClient()
-    token, created = Token.objects.get_or_create(user=authenticated_user)
-    client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+    client.credentials(HTTP_AUTHORIZATION=f'Token {_auth_token}')
     return client, authenticated_user
 
 @pytest.fixture(autouse=True)
 def enable_db_access_for_all_tests(db):
     """Allow database access for all tests"""
-    pass
\ No newline at end of file
+    pass
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Cached responses and tokens must not outlive the test whose rows were rolled back"""
+    cache.clear()
+    yield
+    cache.clear()
+
+@pytest.fixture
+def max_queries(request):
+    """
+    Guard a block against query-count regressions, e.g. N+1 on poll lists.
+
+    The limit comes from the test's ``@pytest.mark.max_queries(n)`` marker:
+
+        with max_queries():
+            response = client.get('/api/v1/polls/')
+    """
+    marker = request.node.get_closest_marker('max_queries')
+    if marker is None:
+        raise pytest.UsageError('max_queries fixture requires @pytest.mark.max_queries(n)')
+    limit = marker.args[0]
+
+    @contextmanager
+    def check():
+        with CaptureQueriesContext(connection) as context:
+            yield context
+        executed = len(context.captured_queries)
+        assert executed <= limit, (
+            f'{executed} queries executed, expected at most {limit}:\n'
+            + '\n'.join(query['sql'] for query in context.captured_queries)
+        )
+
+    return check
@@ -0,0 +1,14 @@
+from django.core.cache import cache
+from django.db import connection, transaction
+
+
+def delete_now_and_on_commit(keys):
+    """
+    Drop the keys, and inside a transaction drop them again once it commits:
+    until then other connections still read the old rows and can put them
+    back in the cache for a full timeout. The first delete keeps the writing
+    transaction's own reads fresh.
+    """
+    cache.delete_many(keys)
+    if connection.in_atomic_block:
+        transaction.on_commit(lambda: cache.delete_many(keys))
@@ -0,0 +1,33 @@
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# orjson is optional: without it the renderer behaves exactly like DRF's JSONRenderer
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    JSONRenderer that encodes with orjson when it is installed.
+
+    orjson handles UUIDs, datetimes (rendered with a trailing 'Z' like DRF)
+    and dict/list/str subclasses such as ReturnDict and ErrorDetail natively;
+    anything else (lazy translation strings, Decimals, querysets, ...) goes
+    through DRF's own JSONEncoder.default.
+    """
+    options = (orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS) if orjson else 0
+    # Stateless, so one bound fallback serves every render
+    default = staticmethod(JSONEncoder().default)
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if orjson is None:
+            return super().render(data, accepted_media_type, renderer_context)
+        if data is None:
+            return b''
+        renderer_context = renderer_context or {}
+        if self.get_indent(accepted_media_type, renderer_context):
+            # orjson only supports 2-space indents; keep DRF's output for pretty-printing
+            return super().render(data, accepted_media_type, renderer_context)
+        return orjson.dumps(data, default=self.default, option=self.options)
@@ -0,0 +1,73 @@
+import copy
+
+from django.db import models
+from rest_framework import serializers
+from rest_framework.fields import SkipField
+from rest_framework.relations import PKOnlyObject
+
+# Unbound field layouts, built on first use per serializer class
+_fields_cache = {}
+
+
+def _copy_field(field):
+    """
+    One-level copy of an unbound field. A many=True serializer also gets
+    its own copy of the child, pointed at the copy, so the child's
+    parent/root (and with it the context) resolve to this instance.
+    Nested serializers build their own fields lazily per copy.
+    """
+    field = copy.copy(field)
+    if isinstance(field, serializers.ListSerializer):
+        field.child = copy.copy(field.child)
+        field.child.parent = field
+    return field
+
+
+class CachedFieldsMixin:
+    """
+    Build a serializer class's fields once and hand each instance a
+    one-level copy, skipping model introspection and the per-instance
+    deepcopy. Readable fields are also resolved once per instance instead
+    of re-walking ``self.fields`` for every object rendered.
+    """
+
+    def get_fields(self):
+        cls = type(self)
+        if cls not in _fields_cache:
+            _fields_cache[cls] = super().get_fields()
+        return {name: _copy_field(field) for name, field in _fields_cache[cls].items()}
+
+    @property
+    def _readable_fields(self):
+        try:
+            return self._cached_readable_fields
+        except AttributeError:
+            self._cached_readable_fields = [
+                field for field in self.fields.values() if not field.write_only
+            ]
+            return self._cached_readable_fields
+
+
+class CachedFieldsListSerializer(serializers.ListSerializer):
+    """
+    Bind the child's fields once up front and render every row of a
+    ``many=True`` response in a single tight loop over that field list,
+    instead of going through ``child.to_representation`` per row.
+    """
+
+    def to_representation(self, data):
+        iterable = data.all() if isinstance(data, models.manager.BaseManager) else data
+        fields = [(field.field_name, field) for field in self.child._readable_fields]
+
+        rows = []
+        for instance in iterable:
+            row = {}
+            for field_name, field in fields:
+                try:
+                    attribute = field.get_attribute(instance)
+                except SkipField:
+                    continue
+                check_for_none = attribute.pk if isinstance(attribute, PKOnlyObject) else attribute
+                row[field_name] = None if check_for_none is None else field.to_representation(attribute)
+            rows.append(row)
+        return rows
@@ -70,6 +70,7 @@ AUTH_USER_MODEL = 'users.User'
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',  # For serving static files on Render
+    'django.middleware.gzip.GZipMiddleware',  # Compress JSON responses; keep above anything touching the body
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -142,6 +143,43 @@ else:
     }
 
 
+# Cache: Redis when REDIS_URL is provided (e.g. a Render Redis instance),
+# otherwise a per-process in-memory cache
+if os.getenv('REDIS_URL'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': os.getenv('REDIS_URL'),
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        }
+    }
+
+# Cache token lookups only when every worker shares the cache: with the
+# per-process cache a logout would evict the entry in one worker only
+TOKEN_AUTHENTICATION_CLASS = (
+    'users.authentication.CachedTokenAuthentication' if os.getenv('REDIS_URL')
+    else 'rest_framework.authentication.TokenAuthentication'
+)
+
+
+# Password hashing
+# https://docs.djangoproject.com/en/5.2/topics/auth/passwords/
+# Argon2id (Django's defaults: time_cost=2, memory_cost=100 MiB, parallelism=8)
+# verifies far faster than PBKDF2's 1M iterations while being memory-hard.
+# Existing PBKDF2 hashes still verify and are upgraded on the next login.
+
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
@@ -194,7 +232,7 @@ DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
 REST_FRAMEWORK = {
     'DEFAULT_AUTHENTICATION_CLASSES': [
-        'rest_framework.authentication.TokenAuthentication',
+        TOKEN_AUTHENTICATION_CLASS,
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ],
     'DEFAULT_PERMISSION_CLASSES': [
@@ -203,7 +241,7 @@ REST_FRAMEWORK = {
     'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'onlinepollsystem.renderers.ORJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
         'rest_framework.parsers.JSONParser',
@@ -218,6 +256,9 @@ SIMPLE_JWT = {
     'ROTATE_REFRESH_TOKENS': True,
 }
 
+# Serve the Swagger/ReDoc docs (and build their schema overrides) only when enabled
+ENABLE_API_DOCS = os.getenv('ENABLE_API_DOCS', 'True').lower() == 'true'
+
 # Add swagger settings
 SWAGGER_SETTINGS = {
     'SECURITY_DEFINITIONS': {
@@ -3,6 +3,13 @@ from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 
+from polls import schemas as poll_schemas
+from users import schemas as user_schemas
+
+# The view overrides are only built when the docs are served
+poll_schemas.register()
+user_schemas.register()
+
 schema_view = get_schema_view(
     openapi.Info(
         title="Online Poll System API",
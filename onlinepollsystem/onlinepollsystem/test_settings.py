@@ -0,0 +1,27 @@
+"""
+Settings for the test suite: the project settings on an in-memory SQLite
+database, so test runs never touch disk or need a running Postgres server.
+"""
+from .settings import *  # noqa: F401,F403
+
+DATABASES = {
+    'default': {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': ':memory:',
+    }
+}
+
+# The production hashers are deliberately slow; tests hash passwords on every
+# register, login and password change, and need no protection from brute force
+PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']
+
+# One process, so the in-memory cache is shared by every request: exercise
+# the cached token lookup production uses with Redis
+TOKEN_AUTHENTICATION_CLASS = 'users.authentication.CachedTokenAuthentication'
+REST_FRAMEWORK = {
+    **REST_FRAMEWORK,
+    'DEFAULT_AUTHENTICATION_CLASSES': [
+        TOKEN_AUTHENTICATION_CLASS,
+        *REST_FRAMEWORK['DEFAULT_AUTHENTICATION_CLASSES'][1:],
+    ],
+}
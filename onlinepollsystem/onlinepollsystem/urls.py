@@ -14,6 +14,7 @@ Including another URLconf
     1. Import the include() function: from django.urls import include, path
     2. Add a URL to urlpatterns:  path('blog/', include('blog.urls'))
 """
+from django.conf import settings
 from django.contrib import admin
 from django.urls import path, include
 
@@ -21,10 +22,12 @@ urlpatterns = [
     path('api/admin/', admin.site.urls),
     path('api/v1/auth/', include('users.auth_urls')),
     path('api/v1/users/', include('users.urls')),
-    path('api/v1/polls/', include('polls.urls')),
-    path('api/v1/options/', include('polls.option_urls')),
+    path('api/v1/', include('polls.urls')),
     path('api/v1/votes/', include('votes.urls')),
     path('api/v1/token/', include('users.token_urls')),
-
-    path('api/docs/', include('onlinepollsystem.swagger_urls')),
 ]
+
+if settings.ENABLE_API_DOCS:
+    urlpatterns += [
+        path('api/docs/', include('onlinepollsystem.swagger_urls')),
+    ]
@@ -0,0 +1,68 @@
+import hashlib
+import uuid
+
+from django.core.cache import cache
+from django.utils.http import quote_etag
+
+from onlinepollsystem.cache import delete_now_and_on_commit
+from onlinepollsystem.renderers import ORJSONRenderer
+
+# Seconds a cached poll response is served for; also bounds how stale is_active can get
+POLL_CACHE_TIMEOUT = 60
+
+# Poll endpoints whose responses are cached per poll
+POLL_CACHE_VIEWS = ('retrieve', 'results', 'options')
+
+# The platform-wide active poll list; any poll, option or vote change drops it,
+# and the short timeout bounds how long a just-expired poll stays listed
+ACTIVE_POLLS_CACHE_KEY = 'polls:active'
+ACTIVE_POLLS_CACHE_TIMEOUT = 30
+
+
+def poll_cache_key(poll_id, view):
+    # Normalise so '/polls/<UPPERCASE-or-hex>/' and str(poll.poll_id) share a key
+    return f'poll:{uuid.UUID(str(poll_id))}:{view}'
+
+
+def get_or_build(poll_id, view, build):
+    """
+    Return ``(etag, data)`` for a poll endpoint, calling build() and caching
+    its result on a miss. Nothing is cached if build() raises (e.g. Http404).
+
+    The ETag is a hash of the rendered body, so it changes whenever the
+    data does (votes included), not just when the poll row is edited.
+    """
+    try:
+        key = poll_cache_key(poll_id, view)
+    except ValueError:
+        # Not a UUID: the view will 404, nothing worth caching
+        return _build_entry(build)
+    return cache.get_or_set(key, lambda: _build_entry(build), POLL_CACHE_TIMEOUT)
+
+
+def get_or_render_active_polls(render):
+    """
+    Return ``(etag, body)`` for the active poll list shared by all users.
+    render() returns the JSON body as bytes, which is what gets cached, so
+    hits are served without rebuilding or re-encoding the list.
+    """
+    def render_entry():
+        body = render()
+        return _etag(body), body
+
+    return cache.get_or_set(ACTIVE_POLLS_CACHE_KEY, render_entry, ACTIVE_POLLS_CACHE_TIMEOUT)
+
+
+def _build_entry(build):
+    data = build()
+    return _etag(ORJSONRenderer().render(data)), data
+
+
+def _etag(body):
+    return quote_etag(hashlib.md5(body).hexdigest())
+
+
+def invalidate_poll_cache(poll_id):
+    keys = [*(poll_cache_key(poll_id, view) for view in POLL_CACHE_VIEWS), ACTIVE_POLLS_CACHE_KEY]
+    delete_now_and_on_commit(keys)
+
@@ -0,0 +1,27 @@
+# Generated by Django 5.2.6 on 2026-10-15 21:36
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='option',
+            index=models.Index(fields=['poll', 'option_text'], name='polls_optio_poll_id_269234_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='poll',
+            index=models.Index(fields=['-created_at'], name='polls_poll_created_fdd0dd_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='poll',
+            index=models.Index(fields=['created_by', '-created_at'], name='polls_poll_created_4753ae_idx'),
+        ),
+    ]
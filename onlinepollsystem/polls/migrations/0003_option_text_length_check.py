@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-15 21:54
+
+import django.db.models.functions.text
+import django.db.models.lookups
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0002_poll_option_indexes'),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='option',
+            constraint=models.CheckConstraint(condition=django.db.models.lookups.LessThanOrEqual(django.db.models.functions.text.Length('option_text'), 200), name='option_text_len'),
+        ),
+    ]
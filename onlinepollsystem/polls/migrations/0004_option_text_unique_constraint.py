@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:29
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0003_option_text_length_check'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='option',
+            name='polls_optio_poll_id_269234_idx',
+        ),
+        migrations.AlterUniqueTogether(
+            name='option',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='option',
+            constraint=models.UniqueConstraint(fields=('poll', 'option_text'), name='uniq_option_text_per_poll'),
+        ),
+    ]
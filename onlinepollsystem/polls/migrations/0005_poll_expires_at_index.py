@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0004_option_text_unique_constraint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='poll',
+            index=models.Index(fields=['expires_at'], name='polls_poll_expires_0c4433_idx'),
+        ),
+    ]
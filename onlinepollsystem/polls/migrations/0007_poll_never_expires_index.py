@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-15 23:02
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0006_poll_created_by_related_name'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='poll',
+            index=models.Index(condition=models.Q(('expires_at__isnull', True)), fields=['-created_at'], name='poll_never_expires'),
+        ),
+    ]
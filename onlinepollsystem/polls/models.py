@@ -1,5 +1,7 @@
 import uuid
 from django.db import models
+from django.db.models.functions import Length
+from django.db.models.lookups import LessThanOrEqual
 from django.utils import timezone
 
 # Create your models here.
@@ -14,20 +16,52 @@ class Poll(models.Model):
     expires_at = models.DateTimeField(null=True, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
-    created_by = models.ForeignKey('users.User', on_delete=models.CASCADE, null=False)
+    created_by = models.ForeignKey('users.User', on_delete=models.CASCADE, null=False, related_name='polls_created')
 
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['-created_at']),
+            models.Index(fields=['created_by', '-created_at']),
+            # active_polls: expires_at IS NULL OR expires_at > now(). The
+            # plain index serves the range half; the partial one lets the
+            # never-expiring half come back already in -created_at order
+            models.Index(fields=['expires_at']),
+            models.Index(
+                fields=['-created_at'],
+                condition=models.Q(expires_at__isnull=True),
+                name='poll_never_expires',
+            ),
+        ]
     
     @property
     def is_active(self):
+        # Prefer the value annotated by the queryset (see PollSerializer.setup_eager_loading)
+        if hasattr(self, '_is_active'):
+            return self._is_active
+        return self.is_active_at(timezone.now())
+
+    def is_active_at(self, now):
         if self.expires_at:
-            return timezone.now() < self.expires_at
+            return now < self.expires_at
         return True
+
+    @is_active.setter
+    def is_active(self, value):
+        self._is_active = value
     
     @property
     def total_votes(self):
-        return sum(option.vote_count for option in self.options.all())
+        # Prefer the value annotated by the queryset (Count('votes'))
+        if hasattr(self, '_total_votes'):
+            return self._total_votes
+        # Unannotated instances (admin, shell, freshly created polls) still
+        # count in a single query rather than one COUNT per option
+        return self.votes.count()
+
+    @total_votes.setter
+    def total_votes(self, value):
+        self._total_votes = value
     
     def __str__(self):
         return self.title
@@ -45,12 +79,28 @@ class Option(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ('poll', 'option_text')
+        constraints = [
+            # Enforced by the database so add_option can insert without a prior
+            # exists() check; its index also serves lookups by (poll, option_text)
+            models.UniqueConstraint(fields=['poll', 'option_text'], name='uniq_option_text_per_poll'),
+            # SQLite does not enforce varchar lengths, so back max_length with a check
+            models.CheckConstraint(
+                condition=LessThanOrEqual(Length('option_text'), 200),
+                name='option_text_len'
+            ),
+        ]
 
 
     @property
     def vote_count(self):
+        # Prefer the value annotated by the queryset (Count('votes'))
+        if hasattr(self, '_vote_count'):
+            return self._vote_count
         return self.votes.count()
 
+    @vote_count.setter
+    def vote_count(self, value):
+        self._vote_count = value
+
     def __str__(self):
         return f'{self.option_text} - {self.poll.title}'
\ No newline at end of file
@@ -0,0 +1,13 @@
+from rest_framework.pagination import CursorPagination
+
+
+class PollCursorPagination(CursorPagination):
+    """
+    Keyset pagination over polls, newest first.
+
+    Each page seeks from the last created_at seen instead of using OFFSET,
+    so deep pages cost the same as the first one and stay stable while new
+    polls are created. Backed by the Poll (-created_at) index.
+    """
+    ordering = '-created_at'
+    page_size = 20
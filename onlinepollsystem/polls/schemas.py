@@ -0,0 +1,928 @@
+"""
+OpenAPI overrides for the poll and option views.
+
+Kept out of polls.views so the (large) schema and example objects are only
+built when the API docs are actually served: register() is called from the
+Swagger URLconf, which is only mounted when settings.ENABLE_API_DOCS is on.
+"""
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+
+from .serializers import PollSerializer
+from .views import OptionViewSet, PollViewSet
+
+_registered = False
+
+
+def register():
+    """Attach the swagger_auto_schema overrides to the view methods (once)."""
+    global _registered
+    if _registered:
+        return
+    _registered = True
+
+    swagger_auto_schema(
+        operation_id="list_polls",
+        operation_summary="List All Polls",
+        operation_description="""
+        Retrieve a paginated list of all polls in the system.
+        
+        **Returns:**
+        - All polls with basic information
+        - Creator details for each poll
+        - Current vote counts and totals
+        - Poll status (active/expired)
+        
+        **Public Endpoint:**
+        - No authentication required
+        - Cursor paginated, newest first (follow `next`/`previous`)
+        - Includes both active and expired polls unless `active` is given
+        """,
+        manual_parameters=[
+            openapi.Parameter(
+                'active',
+                openapi.IN_QUERY,
+                description="Only active (`true`) or only expired (`false`) polls",
+                type=openapi.TYPE_BOOLEAN
+            )
+        ],
+        responses={
+            200: openapi.Response(
+                description="Polls retrieved successfully",
+                examples={
+                    "application/json": {
+                        "next": "http://api.example.com/polls/?cursor=cD0yMDI1LTA5LTE1KzEyJTNBMDAlM0EwMCUyQjAwJTNBMDA%3D",
+                        "previous": None,
+                        "results": [
+                            {
+                                "poll_id": "550e8400-e29b-41d4-a716-446655440000",
+                                "title": "Best Programming Language 2025",
+                                "question": "Which language will dominate in 2025?",
+                                "created_by": {
+                                    "user_id": "123e4567-e89b-12d3-a456-426614174000",
+                                    "username": "techguru",
+                                    "first_name": "Jane",
+                                    "last_name": "Doe",
+                                    "email": "jane@example.com",
+                                    "full_name": "Jane Doe"
+                                },
+                                "created_at": "2025-09-15T12:00:00Z",
+                                "updated_at": "2025-09-20T08:30:00Z",
+                                "expires_at": "2025-12-31T23:59:59Z",
+                                "options": [
+                                    {
+                                        "option_id": "opt-001",
+                                        "option_text": "Python",
+                                        "vote_count": 127,
+                                        "created_at": "2025-09-15T12:00:00Z"
+                                    },
+                                    {
+                                        "option_id": "opt-002",
+                                        "option_text": "JavaScript",
+                                        "vote_count": 98,
+                                        "created_at": "2025-09-15T12:00:00Z"
+                                    }
+                                ],
+                                "total_votes": 225,
+                                "is_active": True
+                            }
+                        ]
+                    }
+                }
+            )
+        },
+        tags=['Polls - CRUD Operations']
+    )(PollViewSet.list)
+
+    swagger_auto_schema(
+        operation_id="retrieve_poll",
+        operation_summary="Get Poll Details",
+        operation_description="""
+        Retrieve detailed information about a specific poll.
+        
+        **Returns:**
+        - Complete poll information
+        - All options with current vote counts
+        - Creator information
+        - Total vote count
+        - Poll status (active/expired)
+        
+        **Public Endpoint:**
+        - No authentication required
+        - Available to all users
+        """,
+        responses={
+            200: openapi.Response(
+                description="Poll details retrieved successfully",
+                schema=PollSerializer,
+                examples={
+                    "application/json": {
+                        "poll_id": "550e8400-e29b-41d4-a716-446655440000",
+                        "title": "Best Frontend Framework 2025",
+                        "question": "Which frontend framework would you recommend for new projects?",
+                        "description": "Community poll to determine trending frontend technologies",
+                        "created_by": {
+                            "user_id": "123e4567-e89b-12d3-a456-426614174000",
+                            "username": "techexpert",
+                            "first_name": "Sarah",
+                            "last_name": "Wilson",
+                            "email": "sarah@example.com",
+                            "full_name": "Sarah Wilson"
+                        },
+                        "created_at": "2025-09-20T14:30:00Z",
+                        "updated_at": "2025-09-25T10:15:00Z",
+                        "expires_at": "2025-10-31T23:59:59Z",
+                        "options": [
+                            {
+                                "option_id": "opt-101",
+                                "option_text": "React",
+                                "vote_count": 45,
+                                "created_at": "2025-09-20T14:30:00Z"
+                            },
+                            {
+                                "option_id": "opt-102",
+                                "option_text": "Vue.js",
+                                "vote_count": 32,
+                                "created_at": "2025-09-20T14:30:00Z"
+                            },
+                            {
+                                "option_id": "opt-103",
+                                "option_text": "Angular",
+                                "vote_count": 18,
+                                "created_at": "2025-09-20T14:30:00Z"
+                            }
+                        ],
+                        "total_votes": 95,
+                        "is_active": True
+                    }
+                }
+            ),
+            404: openapi.Response(
+                description="Poll not found",
+                examples={
+                    "application/json": {
+                        "detail": "Not found."
+                    }
+                }
+            )
+        },
+        tags=['Polls - CRUD Operations']
+    )(PollViewSet.retrieve)
+
+    swagger_auto_schema(
+        operation_id="create_poll",
+        operation_summary="Create New Poll",
+        operation_description="""
+        Create a new poll with multiple options.
+        
+        **Requirements:**
+        - Must be authenticated
+        - Title and question are required
+        - Minimum 2 options required
+        - Each option must have option_text
+        
+        **Optional Fields:**
+        - description: Additional poll description
+        - expires_at: Poll expiration date (ISO format)
+        
+        **Process:**
+        1. Validates poll data
+        2. Creates poll with authenticated user as owner
+        3. Creates all provided options
+        4. Returns complete poll data with options
+        """,
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=['title', 'question', 'options'],
+            properties={
+                'title': openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    description='Poll title (max 200 characters)',
+                    example='Favorite Programming Language'
+                ),
+                'question': openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    description='Main poll question',
+                    example='Which programming language do you prefer for web development?'
+                ),
+                'description': openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    description='Optional poll description',
+                    example='A poll to determine the most popular programming language among developers'
+                ),
+                'expires_at': openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    format=openapi.FORMAT_DATETIME,
+                    description='Poll expiration date (ISO 8601 format)',
+                    example='2025-12-31T23:59:59Z'
+                ),
+                'options': openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    description='List of poll options (minimum 2)',
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        required=['option_text'],
+                        properties={
+                            'option_text': openapi.Schema(
+                                type=openapi.TYPE_STRING,
+                                description='Option text (max 255 characters)',
+                                example='Python'
+                            )
+                        }
+                    ),
+                    example=[
+                        {'option_text': 'Python'},
+                        {'option_text': 'JavaScript'},
+                        {'option_text': 'Java'},
+                        {'option_text': 'Go'}
+                    ]
+                )
+            },
+        ),
+        responses={
+            201: openapi.Response(
+                description="Poll created successfully",
+                schema=PollSerializer,
+                examples={
+                    "application/json": {
+                        "poll_id": "550e8400-e29b-41d4-a716-446655440000",
+                        "title": "Favorite Programming Language",
+                        "question": "Which programming language do you prefer for web development?",
+                        "description": "A poll to determine the most popular programming language",
+                        "created_by": {
+                            "user_id": "123e4567-e89b-12d3-a456-426614174000",
+                            "username": "johndoe",
+                            "first_name": "John",
+                            "last_name": "Doe",
+                            "email": "john@example.com",
+                            "full_name": "John Doe"
+                        },
+                        "created_at": "2025-09-26T10:30:00Z",
+                        "updated_at": "2025-09-26T10:30:00Z",
+                        "expires_at": "2025-12-31T23:59:59Z",
+                        "options": [
+                            {
+                                "option_id": "opt-001",
+                                "option_text": "Python",
+                                "vote_count": 0,
+                                "created_at": "2025-09-26T10:30:00Z"
+                            },
+                            {
+                                "option_id": "opt-002",
+                                "option_text": "JavaScript",
+                                "vote_count": 0,
+                                "created_at": "2025-09-26T10:30:00Z"
+                            }
+                        ],
+                        "total_votes": 0,
+                        "is_active": True
+                    }
+                }
+            ),
+            400: openapi.Response(
+                description="Validation error",
+                examples={
+                    "application/json": {
+                        "title": ["This field is required."],
+                        "options": ["Ensure this field has at least 2 items."]
+                    }
+                }
+            ),
+            401: openapi.Response(
+                description="Authentication required",
+                examples={
+                    "application/json": {
+                        "detail": "Authentication credentials were not provided."
+                    }
+                }
+            )
+        },
+        tags=['Polls - CRUD Operations']
+    )(PollViewSet.create)
+
+    swagger_auto_schema(
+        operation_id="poll_results",
+        operation_summary="Get Poll Results",
+        operation_description="""
+        View the current results of a specific poll.
+        
+        **Returns:**
+        - Poll basic information
+        - All options with vote counts and percentages
+        - Total number of votes
+        - Voting statistics
+        
+        **Public Endpoint:**
+        - No authentication required
+        - Real-time vote counts
+        - Percentage calculations included
+        """,
+        responses={
+            200: openapi.Response(
+                description="Poll results retrieved successfully",
+                examples={
+                    "application/json": {
+                        "poll_id": "550e8400-e29b-41d4-a716-446655440000",
+                        "title": "Best Frontend Framework 2025",
+                        "total_votes": 127,
+                        "results": [
+                            {
+                                "option_id": "opt-101",
+                                "option_text": "React",
+                                "votes": 58,
+                                "percentage": 45.67
+                            },
+                            {
+                                "option_id": "opt-102", 
+                                "option_text": "Vue.js",
+                                "votes": 41,
+                                "percentage": 32.28
+                            },
+                            {
+                                "option_id": "opt-103",
+                                "option_text": "Angular", 
+                                "votes": 28,
+                                "percentage": 22.05
+                            }
+                        ]
+                    }
+                }
+            ),
+            404: openapi.Response(
+                description="Poll not found",
+                examples={
+                    "application/json": {
+                        "detail": "Poll not found."
+                    }
+                }
+            )
+        },
+        tags=['Polls - Results & Analytics']
+    )(PollViewSet.results)
+
+    swagger_auto_schema(
+        operation_id="cast_vote",
+        operation_summary="Cast Vote on Poll",
+        operation_description="""
+        Cast your vote on a specific poll option.
+        
+        **Requirements:**
+        - Must be authenticated
+        - Poll must be active (not expired)
+        - User can only vote once per poll
+        - Option must exist in the poll
+        
+        **Process:**
+        1. Validates poll is active and option exists
+        2. Checks if user has already voted
+        3. Creates vote record
+        4. Updates vote counts
+        5. Returns confirmation with updated totals
+        """,
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=['option_id'],
+            properties={
+                'option_id': openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    description='ID of the option to vote for',
+                    example='opt-102'
+                )
+            },
+        ),
+        responses={
+            201: openapi.Response(
+                description="Vote cast successfully",
+                examples={
+                    "application/json": {
+                        "message": "Vote cast successfully",
+                        "poll_id": "550e8400-e29b-41d4-a716-446655440000",
+                        "option_voted": {
+                            "option_id": "opt-102",
+                            "option_text": "Vue.js",
+                            "vote_count": 42
+                        },
+                        "total_votes": 128,
+                        "vote_timestamp": "2025-09-26T15:30:00Z"
+                    }
+                }
+            ),
+            400: openapi.Response(
+                description="Validation error or poll inactive",
+                examples={
+                    "application/json": {
+                        "detail": "This poll is no longer active"
+                    }
+                }
+            ),
+            401: openapi.Response(
+                description="Authentication required",
+                examples={
+                    "application/json": {
+                        "detail": "Authentication credentials were not provided."
+                    }
+                }
+            ),
+            404: openapi.Response(
+                description="Poll or option not found",
+                examples={
+                    "application/json": {
+                        "detail": "Option not found in this poll."
+                    }
+                }
+            ),
+            409: openapi.Response(
+                description="User has already voted",
+                examples={
+                    "application/json": {
+                        "detail": "You have already voted on this poll."
+                    }
+                }
+            )
+        },
+        tags=['Polls - Voting']
+    )(PollViewSet.vote)
+
+    swagger_auto_schema(
+        operation_id="poll_options",
+        operation_summary="Get Poll Options",
+        operation_description="""
+        Retrieve all available options for a specific poll.
+        
+        **Returns:**
+        - List of all poll options
+        - Option IDs and text
+        - Current vote counts for each option
+        - Creation timestamps
+        
+        **Public Endpoint:**
+        - No authentication required
+        - Useful for displaying voting choices
+        """,
+        responses={
+            200: openapi.Response(
+                description="Poll options retrieved successfully",
+                examples={
+                    "application/json": [
+                        {
+                            "option_id": "opt-101",
+                            "option_text": "React",
+                            "vote_count": 58,
+                            "created_at": "2025-09-20T14:30:00Z",
+                            "poll": "550e8400-e29b-41d4-a716-446655440000"
+                        },
+                        {
+                            "option_id": "opt-102",
+                            "option_text": "Vue.js", 
+                            "vote_count": 42,
+                            "created_at": "2025-09-20T14:30:00Z",
+                            "poll": "550e8400-e29b-41d4-a716-446655440000"
+                        },
+                        {
+                            "option_id": "opt-103",
+                            "option_text": "Angular",
+                            "vote_count": 28,
+                            "created_at": "2025-09-20T14:30:00Z", 
+                            "poll": "550e8400-e29b-41d4-a716-446655440000"
+                        }
+                    ]
+                }
+            ),
+            404: openapi.Response(
+                description="Poll not found",
+                examples={
+                    "application/json": {
+                        "detail": "Poll not found."
+                    }
+                }
+            )
+        },
+        tags=['Polls - Options Management']
+    )(PollViewSet.options)
+
+    swagger_auto_schema(
+        operation_id="add_poll_option",
+        operation_summary="Add New Option to Poll",
+        operation_description="""
+        Add a new option to an existing poll.
+        
+        **Requirements:**
+        - Must be authenticated
+        - Only poll owner can add options
+        - Poll must be active (not expired)
+        - Option text must be unique within the poll
+        
+        **Process:**
+        1. Validates user is poll owner
+        2. Checks poll is still active
+        3. Validates option text is unique
+        4. Creates new option with zero votes
+        5. Returns created option data
+        """,
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=['option_text'],
+            properties={
+                'option_text': openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    description='Text for the new option (max 255 characters)',
+                    example='Svelte'
+                )
+            },
+        ),
+        responses={
+            201: openapi.Response(
+                description="Option added successfully",
+                examples={
+                    "application/json": {
+                        "option_id": "opt-104",
+                        "option_text": "Svelte",
+                        "vote_count": 0,
+                        "created_at": "2025-09-26T16:45:00Z",
+                        "poll": "550e8400-e29b-41d4-a716-446655440000",
+                        "message": "Option added successfully"
+                    }
+                }
+            ),
+            400: openapi.Response(
+                description="Validation error",
+                examples={
+                    "application/json": {
+                        "option_text": ["This field is required."]
+                    }
+                }
+            ),
+            401: openapi.Response(
+                description="Authentication required",
+                examples={
+                    "application/json": {
+                        "detail": "Authentication credentials were not provided."
+                    }
+                }
+            ),
+            403: openapi.Response(
+                description="Permission denied - not poll owner",
+                examples={
+                    "application/json": {
+                        "detail": "You do not have permission to perform this action."
+                    }
+                }
+            ),
+            404: openapi.Response(
+                description="Poll not found",
+                examples={
+                    "application/json": {
+                        "detail": "Poll not found."
+                    }
+                }
+            )
+        },
+        tags=['Polls - Options Management']
+    )(PollViewSet.add_option)
+
+    swagger_auto_schema(
+        operation_id="add_poll_options",
+        operation_summary="Add Several Options to Poll",
+        operation_description="""
+        Add a batch of new options to an existing poll in one request.
+        
+        **Requirements:**
+        - Must be authenticated
+        - Only poll owner can add options
+        - Option texts must be unique within the request and the poll
+        
+        **Process:**
+        1. Validates user is poll owner
+        2. Validates every option text
+        3. Inserts all options in batched INSERTs
+        """,
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=['options'],
+            properties={
+                'options': openapi.Schema(
+                    type=openapi.TYPE_ARRAY,
+                    items=openapi.Schema(
+                        type=openapi.TYPE_OBJECT,
+                        required=['option_text'],
+                        properties={
+                            'option_text': openapi.Schema(
+                                type=openapi.TYPE_STRING,
+                                description='Text for the new option (max 200 characters)'
+                            )
+                        }
+                    ),
+                    example=[{'option_text': 'Svelte'}, {'option_text': 'Solid'}]
+                )
+            },
+        ),
+        responses={
+            201: openapi.Response(
+                description="Options added successfully",
+                examples={
+                    "application/json": {
+                        "message": "2 options added successfully"
+                    }
+                }
+            ),
+            400: openapi.Response(
+                description="Validation error",
+                examples={
+                    "application/json": {
+                        "options": ["Poll options must be unique."]
+                    }
+                }
+            ),
+            403: openapi.Response(
+                description="Permission denied - not poll owner",
+                examples={
+                    "application/json": {
+                        "error": "Only poll owner can add options"
+                    }
+                }
+            )
+        },
+        tags=['Polls - Options Management']
+    )(PollViewSet.add_options)
+
+    swagger_auto_schema(
+        operation_id="my_polls",
+        operation_summary="Get My Polls",
+        operation_description="""
+        Retrieve the polls created by the authenticated user, newest first.
+        
+        **Returns:**
+        - Cursor-paginated list of polls owned by current user
+        - Complete poll information including options
+        - Vote counts and statistics
+        - Creation and expiration dates
+        
+        **Authentication Required:**
+        - Only authenticated users can access
+        - Returns only polls created by the requesting user
+        """,
+        responses={
+            200: openapi.Response(
+                description="User's polls retrieved successfully",
+                examples={
+                    "application/json": {
+                        "next": "http://api.example.com/polls/my_polls/?cursor=cD0yMDI1LTA5LTI1KzA5JTNBMDAlM0EwMCUyQjAwJTNBMDA%3D",
+                        "previous": None,
+                        "results": [
+                            {
+                                "poll_id": "550e8400-e29b-41d4-a716-446655440000",
+                                "title": "Team Lunch Preference",
+                                "question": "What type of cuisine should we order for team lunch?",
+                                "created_by": {
+                                    "user_id": "123e4567-e89b-12d3-a456-426614174000",
+                                    "username": "teamlead",
+                                    "first_name": "Sarah",
+                                    "last_name": "Johnson",
+                                    "email": "sarah@company.com",
+                                    "full_name": "Sarah Johnson"
+                                },
+                                "created_at": "2025-09-25T09:00:00Z",
+                                "updated_at": "2025-09-25T09:00:00Z",
+                                "expires_at": "2025-09-27T18:00:00Z",
+                                "options": [
+                                    {
+                                        "option_id": "opt-201",
+                                        "option_text": "Italian",
+                                        "vote_count": 5,
+                                        "created_at": "2025-09-25T09:00:00Z"
+                                    },
+                                    {
+                                        "option_id": "opt-202",
+                                        "option_text": "Chinese",
+                                        "vote_count": 3,
+                                        "created_at": "2025-09-25T09:00:00Z"
+                                    }
+                                ],
+                                "total_votes": 8,
+                                "is_active": True
+                            }
+                        ]
+                    }
+                }
+            ),
+            401: openapi.Response(
+                description="Authentication required",
+                examples={
+                    "application/json": {
+                        "detail": "Authentication credentials were not provided."
+                    }
+                }
+            )
+        },
+        tags=['Polls - User Collections']
+    )(PollViewSet.my_polls)
+
+    swagger_auto_schema(
+        operation_id="active_polls",
+        operation_summary="Get Active Polls",
+        operation_description="""
+        Retrieve all currently active polls across the platform.
+        
+        **Returns:**
+        - List of all active (non-expired) polls
+        - Public polls available for voting
+        - Complete poll information with options
+        - Real-time vote counts
+        
+        **Filtering:**
+        - Only returns polls that haven't expired
+        - Includes polls from all users
+        - Ordered by creation date (newest first)
+        
+        **Public Endpoint:**
+        - No authentication required
+        - Perfect for browse/discovery functionality
+        """,
+        responses={
+            200: openapi.Response(
+                description="Active polls retrieved successfully", 
+                examples={
+                    "application/json": [
+                        {
+                            "poll_id": "550e8400-e29b-41d4-a716-446655440000",
+                            "title": "Best Frontend Framework 2025",
+                            "question": "Which frontend framework would you recommend?",
+                            "created_by": {
+                                "user_id": "456e7890-e89b-12d3-a456-426614174001",
+                                "username": "developer_pro",
+                                "first_name": "Alex",
+                                "last_name": "Chen",
+                                "email": "alex@example.com",
+                                "full_name": "Alex Chen"
+                            },
+                            "created_at": "2025-09-20T14:30:00Z",
+                            "updated_at": "2025-09-25T10:15:00Z",
+                            "expires_at": "2025-10-31T23:59:59Z",
+                            "options": [
+                                {
+                                    "option_id": "opt-101",
+                                    "option_text": "React",
+                                    "vote_count": 58,
+                                    "created_at": "2025-09-20T14:30:00Z"
+                                },
+                                {
+                                    "option_id": "opt-102",
+                                    "option_text": "Vue.js",
+                                    "vote_count": 42,
+                                    "created_at": "2025-09-20T14:30:00Z"
+                                }
+                            ],
+                            "total_votes": 100,
+                            "is_active": True
+                        }
+                    ]
+                }
+            ),
+            500: openapi.Response(
+                description="Server error",
+                examples={
+                    "application/json": {
+                        "detail": "Internal server error"
+                    }
+                }
+            )
+        },
+        tags=['Polls - User Collections']
+    )(PollViewSet.active_polls)
+
+    swagger_auto_schema(
+        operation_id="list_options",
+        operation_summary="List Poll Options",
+        operation_description="""
+        Retrieve all poll options, optionally filtered by poll.
+        
+        **Query Parameters:**
+        - `poll`: UUID of poll to filter options by
+        
+        **Returns:**
+        - List of options with vote counts
+        - Option IDs and text content
+        - Associated poll information
+        - Creation timestamps
+        
+        **Authentication Required:**
+        - Only authenticated users can access
+        """,
+        manual_parameters=[
+            openapi.Parameter(
+                'poll',
+                openapi.IN_QUERY,
+                description="Filter options by poll UUID",
+                type=openapi.TYPE_STRING,
+                format=openapi.FORMAT_UUID
+            )
+        ],
+        responses={
+            200: openapi.Response(
+                description="Options retrieved successfully",
+                examples={
+                    "application/json": [
+                        {
+                            "option_id": "opt-101",
+                            "option_text": "React",
+                            "vote_count": 45,
+                            "poll": "550e8400-e29b-41d4-a716-446655440000",
+                            "created_at": "2025-09-20T14:30:00Z"
+                        },
+                        {
+                            "option_id": "opt-102",
+                            "option_text": "Vue.js",
+                            "vote_count": 32,
+                            "poll": "550e8400-e29b-41d4-a716-446655440000",
+                            "created_at": "2025-09-20T14:30:00Z"
+                        }
+                    ]
+                }
+            ),
+            401: openapi.Response(
+                description="Authentication required",
+                examples={
+                    "application/json": {
+                        "detail": "Authentication credentials were not provided."
+                    }
+                }
+            )
+        },
+        tags=['Options - Management']
+    )(OptionViewSet.list)
+
+    swagger_auto_schema(
+        operation_id="create_option",
+        operation_summary="Create Poll Option",
+        operation_description="""
+        Create a new option for a specific poll.
+        
+        **Requirements:**
+        - Must be authenticated
+        - Must be the poll owner
+        - Poll must exist and be active
+        - Option text must be unique within the poll
+        
+        **Process:**
+        1. Validates user owns the specified poll
+        2. Checks option text uniqueness
+        3. Creates option with zero votes
+        4. Returns created option data
+        """,
+        request_body=openapi.Schema(
+            type=openapi.TYPE_OBJECT,
+            required=['option_text', 'poll'],
+            properties={
+                'option_text': openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    description='Text content for the option (max 255 characters)',
+                    example='TypeScript'
+                ),
+                'poll': openapi.Schema(
+                    type=openapi.TYPE_STRING,
+                    format=openapi.FORMAT_UUID,
+                    description='UUID of the poll this option belongs to',
+                    example='550e8400-e29b-41d4-a716-446655440000'
+                )
+            },
+        ),
+        responses={
+            201: openapi.Response(
+                description="Option created successfully",
+                examples={
+                    "application/json": {
+                        "option_id": "opt-105",
+                        "option_text": "TypeScript",
+                        "vote_count": 0,
+                        "poll": "550e8400-e29b-41d4-a716-446655440000",
+                        "created_at": "2025-09-26T17:00:00Z"
+                    }
+                }
+            ),
+            400: openapi.Response(
+                description="Validation error",
+                examples={
+                    "application/json": {
+                        "detail": "You can only add options to your own polls"
+                    }
+                }
+            ),
+            401: openapi.Response(
+                description="Authentication required",
+                examples={
+                    "application/json": {
+                        "detail": "Authentication credentials were not provided."
+                    }
+                }
+            ),
+            404: openapi.Response(
+                description="Poll not found",
+                examples={
+                    "application/json": {
+                        "detail": "Poll not found."
+                    }
+                }
+            )
+        },
+        tags=['Options - Management']
+    )(OptionViewSet.create)
@@ -1,67 +1,229 @@
+from django.db import transaction
+from django.db.models import BooleanField, Case, Count, Prefetch, Value, When, prefetch_related_objects
+from django.db.models.functions import Now
+from django.utils import timezone
 from rest_framework import serializers
+from onlinepollsystem.serializers import CachedFieldsListSerializer, CachedFieldsMixin
 from .models import Poll, Option
-from users.serializers import UserSerializer
 
-class OptionSerializer(serializers.ModelSerializer):
-    vote_count = serializers.ReadOnlyField()
+
+# Columns PollSerializer actually reads; everything else (e.g. the creator's
+# password hash) is left out of the SELECT
+POLL_COLUMNS = ('poll_id', 'title', 'question', 'description', 'created_at',
+                'updated_at', 'expires_at', 'created_by')
+CREATOR_COLUMNS = ('user_id', 'username', 'first_name', 'last_name', 'email')
+
+
+def options_prefetch():
+    """A poll's options with their vote counts, in display order"""
+    return Prefetch(
+        'options',
+        queryset=Option.objects.annotate(vote_count=Count('votes')).order_by('created_at')
+    )
+
+
+class OptionSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    vote_count = serializers.IntegerField(read_only=True)
     
     class Meta:
         model = Option
         fields = ('option_id', 'option_text', 'vote_count', 'created_at')
+        # Output-only: writes go through OptionWriteSerializer
+        read_only_fields = fields
+        list_serializer_class = CachedFieldsListSerializer
+
+
+class OptionWriteSerializer(serializers.ModelSerializer):
+    # Only what OptionViewSet's ownership check reads
+    poll = serializers.PrimaryKeyRelatedField(queryset=Poll.objects.only('poll_id', 'created_by_id'))
+
+    class Meta:
+        model = Option
+        fields = ('option_id', 'poll', 'option_text', 'created_at')
         read_only_fields = ('option_id', 'created_at')
 
+    def get_fields(self):
+        fields = super().get_fields()
+        if self.instance is not None:
+            # An option (and its votes) stays with the poll it was created for
+            fields['poll'] = serializers.PrimaryKeyRelatedField(read_only=True)
+        return fields
 
-class PollSerializer(serializers.ModelSerializer):
+    def create(self, validated_data):
+        option = super().create(validated_data)
+        # A new option has no votes; saves a COUNT when rendering the response
+        option.vote_count = 0
+        return option
+
+    def to_representation(self, instance):
+        return OptionSerializer(instance, context=self.context).data
+
+
+class PollSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     options = OptionSerializer(many=True, read_only=True)
-    created_by = UserSerializer(read_only=True)
-    total_votes = serializers.ReadOnlyField()
-    is_active = serializers.ReadOnlyField()
+    created_by = serializers.SerializerMethodField()
+    total_votes = serializers.IntegerField(read_only=True)
+    is_active = serializers.SerializerMethodField()
     
     class Meta:
         model = Poll
         fields = ('poll_id', 'title', 'question', 'description', 'created_by', 'created_at', 
                  'updated_at', 'expires_at', 'options', 'total_votes', 'is_active')
-        read_only_fields = ('poll_id', 'created_at', 'updated_at')
+        # Output-only: writes go through PollCreateSerializer/PollUpdateSerializer
+        read_only_fields = fields
+        list_serializer_class = CachedFieldsListSerializer
+
+    def get_is_active(self, obj):
+        if hasattr(obj, '_is_active'):
+            return obj.is_active
+        # Unannotated polls: share one timestamp across the whole response
+        if '_now' not in self.context:
+            self.context['_now'] = timezone.now()
+        return obj.is_active_at(self.context['_now'])
+
+    def get_created_by(self, obj):
+        # Built straight from the select_related user; a nested UserSerializer
+        # per poll is the most expensive part of rendering a poll list.
+        user = obj.created_by
+        return {
+            'user_id': str(user.user_id),
+            'first_name': user.first_name,
+            'last_name': user.last_name,
+            'full_name': user.full_name,
+            'email': user.email,
+            'username': user.username,
+        }
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        Load everything the serializer reads in a fixed number of queries:
+        the creator via a join, total_votes and is_active as annotations,
+        and the options (with their vote counts) via a single prefetch.
+        """
+        return queryset.select_related('created_by').only(
+            *POLL_COLUMNS, *(f'created_by__{name}' for name in CREATOR_COLUMNS)
+        ).annotate(
+            # Vote carries its poll directly, so count without joining through options
+            total_votes=Count('votes'),
+            is_active=Case(
+                When(expires_at__isnull=True, then=Value(True)),
+                When(expires_at__gt=Now(), then=Value(True)),
+                default=Value(False),
+                output_field=BooleanField()
+            )
+        ).order_by(
+            # Meta.ordering is not applied to queries with aggregates
+            *Poll._meta.ordering
+        ).prefetch_related(options_prefetch())
+
+
+class PollListSerializer(PollSerializer):
+    """
+    PollSerializer without the free-text description, for the list
+    endpoints; clients fetch the poll itself to show the full text.
+    """
+
+    class Meta(PollSerializer.Meta):
+        fields = tuple(name for name in PollSerializer.Meta.fields if name != 'description')
+        read_only_fields = fields
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        return PollSerializer.setup_eager_loading(queryset).defer('description')
+
+
+class PollUpdateSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Poll
+        fields = ('title', 'question', 'description', 'expires_at')
+
+    def update(self, instance, validated_data):
+        instance = super().update(instance, validated_data)
+        # The SQL-annotated is_active predates this write (expires_at may have
+        # changed); drop it so the response computes it from the saved value
+        instance.__dict__.pop('_is_active', None)
+        return instance
+
+    def to_representation(self, instance):
+        # ModelViewSet.update() drops the prefetched options; load them again
+        # with their vote counts rather than a COUNT per option
+        if 'options' not in getattr(instance, '_prefetched_objects_cache', {}):
+            prefetch_related_objects([instance], options_prefetch())
+        return PollSerializer(instance, context=self.context).data
+
+class OptionCreateItemSerializer(serializers.Serializer):
+    option_text = serializers.CharField(max_length=200)
+
 
 class PollCreateSerializer(serializers.ModelSerializer):
-    options = serializers.ListField(
-        child=serializers.DictField(child=serializers.CharField(max_length=255)),
-        write_only=True,
-        min_length=2
-    )
+    options = OptionCreateItemSerializer(many=True, write_only=True, min_length=2)
     
     class Meta:
         model = Poll
         fields = ('title', 'question', 'description', 'expires_at', 'options')
+
+    def validate_options(self, value):
+        # Blank texts are already rejected (and whitespace trimmed) by the child CharField
+        texts = [option_dict['option_text'] for option_dict in value]
+        if len(set(texts)) != len(texts):
+            raise serializers.ValidationError("Poll options must be unique.")
+        return value
     
     def create(self, validated_data):
         options_data = validated_data.pop('options')
-        poll = Poll.objects.create(**validated_data)
-        
-        # Create options
-        for option_dict in options_data:
-            option_text = option_dict.get('option_text', '')
-            if option_text:
-                Option.objects.create(poll=poll, option_text=option_text)
-        
+
+        options = [Option(option_text=option_dict['option_text']) for option_dict in options_data]
+
+        with transaction.atomic():
+            poll = Poll.objects.create(**validated_data)
+            for option in options:
+                option.poll = poll
+            Option.objects.bulk_create(options)
+
+        # A new poll has no votes yet: prime everything PollSerializer reads so
+        # rendering the response needs no further queries
+        for option in options:
+            option.vote_count = 0
+        poll.total_votes = 0
+        # poll.options.all() returns the prefetched rows as they are stored
+        poll._prefetched_objects_cache = {'options': options}
+
         return poll
+
+    def to_representation(self, instance):
+        return PollSerializer(instance, context=self.context).data
     
 class AddOptionSerializer(serializers.Serializer):
-    option_text = serializers.CharField(max_length=255)
+    option_text = serializers.CharField(max_length=200)
     
+    # Single inserts rely on the (poll, option_text) unique constraint instead of
+    # a lookup here; batch callers pass the poll's texts to report every clash
     def validate_option_text(self, value):
-        poll = self.context['poll']
-        if Option.objects.filter(poll=poll, option_text=value).exists():
+        existing_option_texts = self.context.get('existing_option_texts')
+        if existing_option_texts is not None and value in existing_option_texts:
             raise serializers.ValidationError("This option already exists for this poll.")
         return value
+
+class AddOptionsSerializer(serializers.Serializer):
+    options = AddOptionSerializer(many=True, min_length=1)
+
+    def validate_options(self, value):
+        texts = [option_dict['option_text'] for option_dict in value]
+        if len(set(texts)) != len(texts):
+            raise serializers.ValidationError("Poll options must be unique.")
+        return value
     
 class CastVoteSerializer(serializers.Serializer):
     option_id = serializers.UUIDField()
     
     def validate_option_id(self, value):
-        poll = self.context['poll']
+        # Load the option together with the poll fields the vote needs, so the
+        # poll lookup, expiry check and option check share a single query
         try:
-            option = Option.objects.get(option_id=value, poll=poll)
+            option = Option.objects.select_related('poll').only(
+                'option_id', 'option_text', 'poll__poll_id', 'poll__expires_at'
+            ).get(option_id=value, poll_id=self.context['poll_id'])
             return option
         except Option.DoesNotExist:
             raise serializers.ValidationError("Invalid option for this poll.")
\ No newline at end of file
@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from .cache import invalidate_poll_cache
+from .models import Option, Poll
+from votes.models import Vote
+
+
+@receiver([post_save, post_delete], sender=Poll)
+def invalidate_poll(sender, instance, **kwargs):
+    invalidate_poll_cache(instance.pk)
+
+
+@receiver([post_save, post_delete], sender=Option)
+@receiver([post_save, post_delete], sender=Vote)
+def invalidate_parent_poll(sender, instance, **kwargs):
+    invalidate_poll_cache(instance.poll_id)
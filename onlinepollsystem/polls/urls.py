@@ -1,9 +1,10 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from .views import PollViewSet
+from .views import PollViewSet, OptionViewSet
 
 router = DefaultRouter()
-router.register(r'', PollViewSet, basename='polls')
+router.register(r'polls', PollViewSet, basename='polls')
+router.register(r'options', OptionViewSet, basename='options')
 
 urlpatterns = [
     path('', include(router.urls)),
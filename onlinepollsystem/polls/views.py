@@ -1,23 +1,57 @@
+import uuid
+from itertools import islice
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
+from rest_framework.exceptions import PermissionDenied
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated, AllowAny, BasePermission
+from django.http import HttpResponse
 from django.shortcuts import get_object_or_404
-from django.db import models
+from django.utils.http import parse_etags
+from django.db import IntegrityError, transaction
+from django.db.models import Count, Q
+from django.db.models.functions import Now
 from rest_framework import serializers
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 
+from .cache import get_or_build, get_or_render_active_polls, invalidate_poll_cache
 from .models import Poll, Option
+from .pagination import PollCursorPagination
 from .serializers import (
     PollSerializer,
+    PollListSerializer,
     PollCreateSerializer,
+    PollUpdateSerializer,
     OptionSerializer,
+    OptionWriteSerializer,
     AddOptionSerializer,
+    AddOptionsSerializer,
     CastVoteSerializer
 )
+from onlinepollsystem.renderers import ORJSONRenderer
 from votes.models import Vote
 
+# Polls materialised at once when rendering the active poll list
+POLL_CHUNK_SIZE = 500
+# Rows per INSERT when bulk-adding options
+OPTION_BATCH_SIZE = 500
+# Poll listings render PollListSerializer, which leaves out the description
+LIST_ACTIONS = ('list', 'my_polls')
+
+def client_has_etag(request, etag):
+    # If-None-Match uses weak comparison, and GZipMiddleware hands out W/ ETags
+    client_etags = {tag.removeprefix('W/') for tag in parse_etags(request.headers.get('If-None-Match', ''))}
+    return etag in client_etags or '*' in client_etags
+
+def conditional_response(request, etag, data):
+    """Answer with 304 and no body when the client already holds this ETag."""
+    if client_has_etag(request, etag):
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(data)
+    response['ETag'] = etag
+    return response
+
 class IsPollOwnerOrReadOnly(BasePermission):
     """
     Custom permission to only allow owners of a poll to edit it.
@@ -27,7 +61,8 @@ class IsPollOwnerOrReadOnly(BasePermission):
             return True
         
         # Write permissions are only allowed to the owner of the poll.
-        return obj.created_by == request.user
+        # Compare ids so the owner check needs no join to the user table
+        return obj.created_by_id == request.user.pk
 
 class PollViewSet(viewsets.ModelViewSet):
     """
@@ -50,811 +85,319 @@ class PollViewSet(viewsets.ModelViewSet):
     - **Vote**: Authenticated users only
     """
     permission_classes = [IsAuthenticated]
+    pagination_class = PollCursorPagination
+    # The permission classes are stateless, so share one instance of each per action group
+    _PERM_SETS = {
+        'read': (AllowAny(),),
+        'write_owner': (IsAuthenticated(), IsPollOwnerOrReadOnly()),
+        'write': (IsAuthenticated(),),
+    }
     
     def get_queryset(self):
-        return Poll.objects.all().select_related('created_by').prefetch_related('options')
+        if self.action == 'results':
+            # results aggregates the options itself; skip the eager loading
+            return Poll.objects.only('poll_id', 'title')
+        if self.action == 'options':
+            return Poll.objects.only('poll_id')
+        # Write paths: load only what the expiry and ownership checks need, so
+        # get_object() is a single narrow SELECT without joins or prefetches
+        if self.action == 'vote':
+            # Only reached when the vote fails validation (see vote())
+            return Poll.objects.only('poll_id', 'expires_at')
+        if self.action in ['add_option', 'add_options', 'destroy']:
+            return Poll.objects.only('poll_id', 'created_by_id')
+        if self.action == 'my_polls':
+            # The reverse manager is already scoped to the user
+            queryset = self.request.user.polls_created.all()
+        else:
+            queryset = Poll.objects.all()
+        serializer_class = PollListSerializer if self.action in LIST_ACTIONS else PollSerializer
+        queryset = serializer_class.setup_eager_loading(queryset)
+        active = self.request.query_params.get('active')
+        if self.action == 'list' and active is not None:
+            # is_active is annotated in SQL, so this filters in the database
+            queryset = queryset.filter(is_active=active.lower() in ('true', '1'))
+        return queryset
     
     def get_serializer_class(self):
         if self.action == 'create':
             return PollCreateSerializer
+        if self.action in ['update', 'partial_update']:
+            return PollUpdateSerializer
+        if self.action in LIST_ACTIONS:
+            return PollListSerializer
         return PollSerializer
     
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
 
-    @swagger_auto_schema(
-        operation_id="list_polls",
-        operation_summary="List All Polls",
-        operation_description="""
-        Retrieve a paginated list of all polls in the system.
-        
-        **Returns:**
-        - All polls with basic information
-        - Creator details for each poll
-        - Current vote counts and totals
-        - Poll status (active/expired)
-        
-        **Public Endpoint:**
-        - No authentication required
-        - Supports pagination
-        - Includes both active and expired polls
-        """,
-        responses={
-            200: openapi.Response(
-                description="Polls retrieved successfully",
-                examples={
-                    "application/json": {
-                        "count": 25,
-                        "next": "http://api.example.com/polls/?page=2",
-                        "previous": None,
-                        "results": [
-                            {
-                                "poll_id": "550e8400-e29b-41d4-a716-446655440000",
-                                "title": "Best Programming Language 2025",
-                                "question": "Which language will dominate in 2025?",
-                                "description": "Annual community survey on programming languages",
-                                "created_by": {
-                                    "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                                    "username": "techguru",
-                                    "first_name": "Jane",
-                                    "last_name": "Doe",
-                                    "email": "jane@example.com",
-                                    "full_name": "Jane Doe"
-                                },
-                                "created_at": "2025-09-15T12:00:00Z",
-                                "updated_at": "2025-09-20T08:30:00Z",
-                                "expires_at": "2025-12-31T23:59:59Z",
-                                "options": [
-                                    {
-                                        "option_id": "opt-001",
-                                        "option_text": "Python",
-                                        "vote_count": 127,
-                                        "created_at": "2025-09-15T12:00:00Z"
-                                    },
-                                    {
-                                        "option_id": "opt-002",
-                                        "option_text": "JavaScript",
-                                        "vote_count": 98,
-                                        "created_at": "2025-09-15T12:00:00Z"
-                                    }
-                                ],
-                                "total_votes": 225,
-                                "is_active": True
-                            }
-                        ]
-                    }
-                }
-            )
-        },
-        tags=['Polls - CRUD Operations']
-    )
+    # Overridden so polls.schemas attaches its docs to this class, not the shared mixins
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-    @swagger_auto_schema(
-        operation_id="retrieve_poll",
-        operation_summary="Get Poll Details",
-        operation_description="""
-        Retrieve detailed information about a specific poll.
-        
-        **Returns:**
-        - Complete poll information
-        - All options with current vote counts
-        - Creator information
-        - Total vote count
-        - Poll status (active/expired)
-        
-        **Public Endpoint:**
-        - No authentication required
-        - Available to all users
-        """,
-        responses={
-            200: openapi.Response(
-                description="Poll details retrieved successfully",
-                schema=PollSerializer,
-                examples={
-                    "application/json": {
-                        "poll_id": "550e8400-e29b-41d4-a716-446655440000",
-                        "title": "Best Frontend Framework 2025",
-                        "question": "Which frontend framework would you recommend for new projects?",
-                        "description": "Community poll to determine trending frontend technologies",
-                        "created_by": {
-                            "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                            "username": "techexpert",
-                            "first_name": "Sarah",
-                            "last_name": "Wilson",
-                            "email": "sarah@example.com",
-                            "full_name": "Sarah Wilson"
-                        },
-                        "created_at": "2025-09-20T14:30:00Z",
-                        "updated_at": "2025-09-25T10:15:00Z",
-                        "expires_at": "2025-10-31T23:59:59Z",
-                        "options": [
-                            {
-                                "option_id": "opt-101",
-                                "option_text": "React",
-                                "vote_count": 45,
-                                "created_at": "2025-09-20T14:30:00Z"
-                            },
-                            {
-                                "option_id": "opt-102",
-                                "option_text": "Vue.js",
-                                "vote_count": 32,
-                                "created_at": "2025-09-20T14:30:00Z"
-                            },
-                            {
-                                "option_id": "opt-103",
-                                "option_text": "Angular",
-                                "vote_count": 18,
-                                "created_at": "2025-09-20T14:30:00Z"
-                            }
-                        ],
-                        "total_votes": 95,
-                        "is_active": True
-                    }
-                }
-            ),
-            404: openapi.Response(
-                description="Poll not found",
-                examples={
-                    "application/json": {
-                        "detail": "Not found."
-                    }
-                }
-            )
-        },
-        tags=['Polls - CRUD Operations']
-    )
     def retrieve(self, request, *args, **kwargs):
-        return super().retrieve(request, *args, **kwargs)
+        etag, data = get_or_build(
+            kwargs['pk'], 'retrieve', lambda: dict(self.get_serializer(self.get_object()).data)
+        )
+        return conditional_response(request, etag, data)
     
-    @swagger_auto_schema(
-        operation_id="create_poll",
-        operation_summary="Create New Poll",
-        operation_description="""
-        Create a new poll with multiple options.
-        
-        **Requirements:**
-        - Must be authenticated
-        - Title and question are required
-        - Minimum 2 options required
-        - Each option must have option_text
-        
-        **Optional Fields:**
-        - description: Additional poll description
-        - expires_at: Poll expiration date (ISO format)
-        
-        **Process:**
-        1. Validates poll data
-        2. Creates poll with authenticated user as owner
-        3. Creates all provided options
-        4. Returns complete poll data with options
-        """,
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            required=['title', 'question', 'options'],
-            properties={
-                'title': openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    description='Poll title (max 200 characters)',
-                    example='Favorite Programming Language'
-                ),
-                'question': openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    description='Main poll question',
-                    example='Which programming language do you prefer for web development?'
-                ),
-                'description': openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    description='Optional poll description',
-                    example='A poll to determine the most popular programming language among developers'
-                ),
-                'expires_at': openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    format=openapi.FORMAT_DATETIME,
-                    description='Poll expiration date (ISO 8601 format)',
-                    example='2025-12-31T23:59:59Z'
-                ),
-                'options': openapi.Schema(
-                    type=openapi.TYPE_ARRAY,
-                    description='List of poll options (minimum 2)',
-                    items=openapi.Schema(
-                        type=openapi.TYPE_OBJECT,
-                        required=['option_text'],
-                        properties={
-                            'option_text': openapi.Schema(
-                                type=openapi.TYPE_STRING,
-                                description='Option text (max 255 characters)',
-                                example='Python'
-                            )
-                        }
-                    ),
-                    example=[
-                        {'option_text': 'Python'},
-                        {'option_text': 'JavaScript'},
-                        {'option_text': 'Java'},
-                        {'option_text': 'Go'}
-                    ]
-                )
-            },
-        ),
-        responses={
-            201: openapi.Response(
-                description="Poll created successfully",
-                schema=PollSerializer,
-                examples={
-                    "application/json": {
-                        "poll_id": "550e8400-e29b-41d4-a716-446655440000",
-                        "title": "Favorite Programming Language",
-                        "question": "Which programming language do you prefer for web development?",
-                        "description": "A poll to determine the most popular programming language",
-                        "created_by": {
-                            "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                            "username": "johndoe",
-                            "first_name": "John",
-                            "last_name": "Doe",
-                            "email": "john@example.com",
-                            "full_name": "John Doe"
-                        },
-                        "created_at": "2025-09-26T10:30:00Z",
-                        "updated_at": "2025-09-26T10:30:00Z",
-                        "expires_at": "2025-12-31T23:59:59Z",
-                        "options": [
-                            {
-                                "option_id": "opt-001",
-                                "option_text": "Python",
-                                "vote_count": 0,
-                                "created_at": "2025-09-26T10:30:00Z"
-                            },
-                            {
-                                "option_id": "opt-002",
-                                "option_text": "JavaScript",
-                                "vote_count": 0,
-                                "created_at": "2025-09-26T10:30:00Z"
-                            }
-                        ],
-                        "total_votes": 0,
-                        "is_active": True
-                    }
-                }
-            ),
-            400: openapi.Response(
-                description="Validation error",
-                examples={
-                    "application/json": {
-                        "title": ["This field is required."],
-                        "options": ["Ensure this field has at least 2 items."]
-                    }
-                }
-            ),
-            401: openapi.Response(
-                description="Authentication required",
-                examples={
-                    "application/json": {
-                        "detail": "Authentication credentials were not provided."
-                    }
-                }
-            )
-        },
-        tags=['Polls - CRUD Operations']
-    )
     def create(self, request, *args, **kwargs):
         """Create poll and return full poll data"""
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        poll = serializer.save(created_by=self.request.user)
-        
-        response_serializer = PollSerializer(poll, context={'request': request})
-        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+        serializer.save(created_by=self.request.user)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
     
     def get_permissions(self):
         """Set permissions based on action"""
         if self.action in ['list', 'retrieve', 'results']:
-            permission_classes = [AllowAny]
+            return self._PERM_SETS['read']
         elif self.action in ['update', 'partial_update', 'destroy']:
-            permission_classes = [IsAuthenticated, IsPollOwnerOrReadOnly]
-        else:
-            permission_classes = [IsAuthenticated]
-        return [permission() for permission in permission_classes]
+            return self._PERM_SETS['write_owner']
+        return self._PERM_SETS['write']
     
     @action(detail=True, methods=['get'])
-    @swagger_auto_schema(
-        operation_id="poll_results",
-        operation_summary="Get Poll Results",
-        operation_description="""
-        View the current results of a specific poll.
-        
-        **Returns:**
-        - Poll basic information
-        - All options with vote counts and percentages
-        - Total number of votes
-        - Voting statistics
-        
-        **Public Endpoint:**
-        - No authentication required
-        - Real-time vote counts
-        - Percentage calculations included
-        """,
-        responses={
-            200: openapi.Response(
-                description="Poll results retrieved successfully",
-                examples={
-                    "application/json": {
-                        "poll_id": "550e8400-e29b-41d4-a716-446655440000",
-                        "title": "Best Frontend Framework 2025",
-                        "total_votes": 127,
-                        "results": [
-                            {
-                                "option_id": "opt-101",
-                                "option_text": "React",
-                                "votes": 58,
-                                "percentage": 45.67
-                            },
-                            {
-                                "option_id": "opt-102", 
-                                "option_text": "Vue.js",
-                                "votes": 41,
-                                "percentage": 32.28
-                            },
-                            {
-                                "option_id": "opt-103",
-                                "option_text": "Angular", 
-                                "votes": 28,
-                                "percentage": 22.05
-                            }
-                        ]
-                    }
-                }
-            ),
-            404: openapi.Response(
-                description="Poll not found",
-                examples={
-                    "application/json": {
-                        "detail": "Poll not found."
-                    }
-                }
-            )
-        },
-        tags=['Polls - Results & Analytics']
-    )
     def results(self, request, pk=None):
         """Get poll results"""
+        return conditional_response(request, *get_or_build(pk, 'results', self._build_results))
+
+    def _build_results(self):
         poll = self.get_object()
+        rows = list(
+            poll.options.annotate(vote_total=Count('votes'))
+            .order_by('created_at')
+            .values_list('option_id', 'option_text', 'vote_total')
+        )
+        total_votes = sum(votes for _, _, votes in rows)
         options_data = []
         
-        for option in poll.options.all():
+        for option_id, option_text, votes in rows:
             options_data.append({
-                'option_id': option.option_id,
-                'option_text': option.option_text,
-                'votes': option.vote_count,
-                'percentage': (option.vote_count / poll.total_votes * 100) if poll.total_votes > 0 else 0
+                'option_id': option_id,
+                'option_text': option_text,
+                'votes': votes,
+                'percentage': (votes / total_votes * 100) if total_votes > 0 else 0
             })
         
-        return Response({
+        return {
             'poll_id': poll.poll_id,
             'title': poll.title,
-            'total_votes': poll.total_votes,
+            'total_votes': total_votes,
             'results': options_data
-        })
+        }
     
     @action(detail=True, methods=['post'])
-    @swagger_auto_schema(
-        operation_id="cast_vote",
-        operation_summary="Cast Vote on Poll",
-        operation_description="""
-        Cast your vote on a specific poll option.
-        
-        **Requirements:**
-        - Must be authenticated
-        - Poll must be active (not expired)
-        - User can only vote once per poll
-        - Option must exist in the poll
-        
-        **Process:**
-        1. Validates poll is active and option exists
-        2. Checks if user has already voted
-        3. Creates vote record
-        4. Updates vote counts
-        5. Returns confirmation with updated totals
-        """,
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            required=['option_id'],
-            properties={
-                'option_id': openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    description='ID of the option to vote for',
-                    example='opt-102'
-                )
-            },
-        ),
-        responses={
-            200: openapi.Response(
-                description="Vote cast successfully",
-                examples={
-                    "application/json": {
-                        "message": "Vote cast successfully",
-                        "poll_id": "550e8400-e29b-41d4-a716-446655440000",
-                        "option_voted": {
-                            "option_id": "opt-102",
-                            "option_text": "Vue.js",
-                            "vote_count": 42
-                        },
-                        "total_votes": 128,
-                        "vote_timestamp": "2025-09-26T15:30:00Z"
-                    }
-                }
-            ),
-            400: openapi.Response(
-                description="Validation error or poll inactive",
-                examples={
-                    "application/json": {
-                        "detail": "This poll is no longer active"
-                    }
-                }
-            ),
-            401: openapi.Response(
-                description="Authentication required",
-                examples={
-                    "application/json": {
-                        "detail": "Authentication credentials were not provided."
-                    }
-                }
-            ),
-            404: openapi.Response(
-                description="Poll or option not found",
-                examples={
-                    "application/json": {
-                        "detail": "Option not found in this poll."
-                    }
-                }
-            ),
-            409: openapi.Response(
-                description="User has already voted",
-                examples={
-                    "application/json": {
-                        "detail": "You have already voted on this poll."
-                    }
-                }
-            )
-        },
-        tags=['Polls - Voting']
-    )
     def vote(self, request, pk=None):
         """Cast vote on poll"""
+        serializer = CastVoteSerializer(data=request.data, context={'poll_id': pk})
+        if serializer.is_valid():
+            option = serializer.validated_data['option_id']
+            poll = option.poll
+            self.check_object_permissions(request, poll)
+            
+            if not poll.is_active:
+                return Response({'error': 'This poll has expired'}, status=status.HTTP_400_BAD_REQUEST)
+            
+            # Let the (poll, user) unique constraint reject repeat votes instead of
+            # checking first: one round-trip, and no race between check and insert
+            try:
+                with transaction.atomic():
+                    vote = Vote.objects.create(poll=poll, option=option, user=request.user)
+                    # Both tallies in one aggregate over the poll's votes, read in the
+                    # same transaction as the insert so they include this vote
+                    counts = Vote.objects.filter(poll=poll).aggregate(
+                        total_votes=Count('pk'),
+                        vote_count=Count('pk', filter=Q(option=option))
+                    )
+            except IntegrityError:
+                return Response({'error': 'You have already voted on this poll'}, status=status.HTTP_400_BAD_REQUEST)
+            return Response({
+                'message': 'Vote cast successfully',
+                'poll_id': poll.poll_id,
+                'option_voted': {
+                    'option_id': option.option_id,
+                    'option_text': option.option_text,
+                    'vote_count': counts['vote_count']
+                },
+                'total_votes': counts['total_votes'],
+                'vote_timestamp': vote.timestamp
+            }, status=status.HTTP_201_CREATED)
+        
+        # Only the error path looks the poll up on its own, to answer 404 for a
+        # missing poll and report expiry ahead of a bad option
         poll = self.get_object()
-        
         if not poll.is_active:
             return Response({'error': 'This poll has expired'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        if Vote.objects.filter(poll=poll, user=request.user).exists():
-            return Response({'error': 'You have already voted on this poll'}, status=status.HTTP_400_BAD_REQUEST)
-        
-        serializer = CastVoteSerializer(data=request.data, context={'poll': poll})
-        if serializer.is_valid():
-            option = serializer.validated_data['option_id']
-            Vote.objects.create(poll=poll, option=option, user=request.user)
-            return Response({'message': 'Vote cast successfully'}, status=status.HTTP_201_CREATED)
-        
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
     
     @action(detail=True, methods=['get'])
-    @swagger_auto_schema(
-        operation_id="poll_options",
-        operation_summary="Get Poll Options",
-        operation_description="""
-        Retrieve all available options for a specific poll.
-        
-        **Returns:**
-        - List of all poll options
-        - Option IDs and text
-        - Current vote counts for each option
-        - Creation timestamps
-        
-        **Public Endpoint:**
-        - No authentication required
-        - Useful for displaying voting choices
-        """,
-        responses={
-            200: openapi.Response(
-                description="Poll options retrieved successfully",
-                examples={
-                    "application/json": [
-                        {
-                            "option_id": "opt-101",
-                            "option_text": "React",
-                            "vote_count": 58,
-                            "created_at": "2025-09-20T14:30:00Z",
-                            "poll": "550e8400-e29b-41d4-a716-446655440000"
-                        },
-                        {
-                            "option_id": "opt-102",
-                            "option_text": "Vue.js", 
-                            "vote_count": 42,
-                            "created_at": "2025-09-20T14:30:00Z",
-                            "poll": "550e8400-e29b-41d4-a716-446655440000"
-                        },
-                        {
-                            "option_id": "opt-103",
-                            "option_text": "Angular",
-                            "vote_count": 28,
-                            "created_at": "2025-09-20T14:30:00Z", 
-                            "poll": "550e8400-e29b-41d4-a716-446655440000"
-                        }
-                    ]
-                }
-            ),
-            404: openapi.Response(
-                description="Poll not found",
-                examples={
-                    "application/json": {
-                        "detail": "Poll not found."
-                    }
-                }
-            )
-        },
-        tags=['Polls - Options Management']
-    )
     def options(self, request, pk=None):
         """Get poll options"""
+        return conditional_response(request, *get_or_build(pk, 'options', self._build_options))
+
+    def _build_options(self):
         poll = self.get_object()
-        serializer = OptionSerializer(poll.options.all(), many=True)
-        return Response(serializer.data)
+        # Plain dict rows straight from the DB; the JSON renderer handles the
+        # UUID/datetime values, so no Option instances or serializer are needed
+        return list(
+            Option.objects.filter(poll=poll).annotate(
+                vote_count=Count('votes')
+            ).order_by('created_at').values('option_id', 'option_text', 'vote_count', 'created_at')
+        )
     
     @action(detail=True, methods=['post'])
-    @swagger_auto_schema(
-        operation_id="add_poll_option",
-        operation_summary="Add New Option to Poll",
-        operation_description="""
-        Add a new option to an existing poll.
-        
-        **Requirements:**
-        - Must be authenticated
-        - Only poll owner can add options
-        - Poll must be active (not expired)
-        - Option text must be unique within the poll
-        
-        **Process:**
-        1. Validates user is poll owner
-        2. Checks poll is still active
-        3. Validates option text is unique
-        4. Creates new option with zero votes
-        5. Returns created option data
-        """,
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            required=['option_text'],
-            properties={
-                'option_text': openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    description='Text for the new option (max 255 characters)',
-                    example='Svelte'
-                )
-            },
-        ),
-        responses={
-            201: openapi.Response(
-                description="Option added successfully",
-                examples={
-                    "application/json": {
-                        "option_id": "opt-104",
-                        "option_text": "Svelte",
-                        "vote_count": 0,
-                        "created_at": "2025-09-26T16:45:00Z",
-                        "poll": "550e8400-e29b-41d4-a716-446655440000",
-                        "message": "Option added successfully"
-                    }
-                }
-            ),
-            400: openapi.Response(
-                description="Validation error",
-                examples={
-                    "application/json": {
-                        "option_text": ["This field is required."]
-                    }
-                }
-            ),
-            401: openapi.Response(
-                description="Authentication required",
-                examples={
-                    "application/json": {
-                        "detail": "Authentication credentials were not provided."
-                    }
-                }
-            ),
-            403: openapi.Response(
-                description="Permission denied - not poll owner",
-                examples={
-                    "application/json": {
-                        "detail": "You do not have permission to perform this action."
-                    }
-                }
-            ),
-            404: openapi.Response(
-                description="Poll not found",
-                examples={
-                    "application/json": {
-                        "detail": "Poll not found."
-                    }
-                }
-            )
-        },
-        tags=['Polls - Options Management']
-    )
     def add_option(self, request, pk=None):
         """Add option to poll (owner only)"""
         poll = self.get_object()
         
-        if poll.created_by != request.user:
+        # Compare ids so the owner check needs no join to the user table
+        if poll.created_by_id != request.user.pk:
             return Response({'error': 'Only poll owner can add options'}, status=status.HTTP_403_FORBIDDEN)
         
         serializer = AddOptionSerializer(data=request.data, context={'poll': poll})
         if serializer.is_valid():
-            Option.objects.create(
-                poll=poll,
-                option_text=serializer.validated_data['option_text']
-            )
+            try:
+                with transaction.atomic():
+                    Option.objects.create(
+                        poll=poll,
+                        option_text=serializer.validated_data['option_text']
+                    )
+            except IntegrityError:
+                return Response(
+                    {'option_text': ['This option already exists for this poll.']},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
             return Response({'message': 'Option added successfully'}, status=status.HTTP_201_CREATED)
         
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
-    
-    @action(detail=False, methods=['get'])
-    @swagger_auto_schema(
-        operation_id="my_polls",
-        operation_summary="Get My Polls",
-        operation_description="""
-        Retrieve all polls created by the authenticated user.
+
+    @action(detail=True, methods=['post'])
+    def add_options(self, request, pk=None):
+        """Add several options to a poll in one request (owner only)"""
+        poll = self.get_object()
         
-        **Returns:**
-        - List of polls owned by current user
-        - Complete poll information including options
-        - Vote counts and statistics
-        - Creation and expiration dates
+        if poll.created_by_id != request.user.pk:
+            return Response({'error': 'Only poll owner can add options'}, status=status.HTTP_403_FORBIDDEN)
         
-        **Authentication Required:**
-        - Only authenticated users can access
-        - Returns only polls created by the requesting user
-        """,
-        responses={
-            200: openapi.Response(
-                description="User's polls retrieved successfully",
-                examples={
-                    "application/json": [
-                        {
-                            "poll_id": "550e8400-e29b-41d4-a716-446655440000",
-                            "title": "Team Lunch Preference",
-                            "question": "What type of cuisine should we order for team lunch?",
-                            "description": "Weekly team lunch poll",
-                            "created_by": {
-                                "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                                "username": "teamlead",
-                                "first_name": "Sarah",
-                                "last_name": "Johnson",
-                                "email": "sarah@company.com",
-                                "full_name": "Sarah Johnson"
-                            },
-                            "created_at": "2025-09-25T09:00:00Z",
-                            "updated_at": "2025-09-25T09:00:00Z",
-                            "expires_at": "2025-09-27T18:00:00Z",
-                            "options": [
-                                {
-                                    "option_id": "opt-201",
-                                    "option_text": "Italian",
-                                    "vote_count": 5,
-                                    "created_at": "2025-09-25T09:00:00Z"
-                                },
-                                {
-                                    "option_id": "opt-202",
-                                    "option_text": "Chinese",
-                                    "vote_count": 3,
-                                    "created_at": "2025-09-25T09:00:00Z"
-                                }
-                            ],
-                            "total_votes": 8,
-                            "is_active": True
-                        }
-                    ]
-                }
-            ),
-            401: openapi.Response(
-                description="Authentication required",
-                examples={
-                    "application/json": {
-                        "detail": "Authentication credentials were not provided."
-                    }
-                }
+        # One query for the existing texts instead of an exists() per submitted option
+        existing_option_texts = set(poll.options.values_list('option_text', flat=True))
+        serializer = AddOptionsSerializer(
+            data=request.data,
+            context={'poll': poll, 'existing_option_texts': existing_option_texts}
+        )
+        if serializer.is_valid():
+            options = [
+                Option(poll=poll, option_text=option_dict['option_text'])
+                for option_dict in serializer.validated_data['options']
+            ]
+            # A text added concurrently since the check above trips the unique
+            # constraint; the batch then rolls back as a whole
+            try:
+                with transaction.atomic():
+                    Option.objects.bulk_create(options, batch_size=OPTION_BATCH_SIZE)
+            except IntegrityError:
+                return Response(
+                    {'options': ['One or more options already exist for this poll.']},
+                    status=status.HTTP_400_BAD_REQUEST
+                )
+            # bulk_create sends no post_save, so drop the cached poll views here
+            invalidate_poll_cache(poll.pk)
+            return Response(
+                {'message': f'{len(options)} options added successfully'},
+                status=status.HTTP_201_CREATED
             )
-        },
-        tags=['Polls - User Collections']
-    )
+        
+        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+    
+    @action(detail=False, methods=['get'])
     def my_polls(self, request):
         """Get current user's polls"""
-        polls = Poll.objects.filter(created_by=request.user)
-        serializer = PollSerializer(polls, many=True)
-        return Response(serializer.data)
+        polls = self.filter_queryset(self.get_queryset())
+        # The cursor paginator orders by -created_at, so each page is a range
+        # scan of the (created_by, -created_at) index
+        page = self.paginate_queryset(polls)
+        return self.get_paginated_response(self.get_serializer(page, many=True).data)
     
     @action(detail=False, methods=['get'])
-    @swagger_auto_schema(
-        operation_id="active_polls",
-        operation_summary="Get Active Polls",
-        operation_description="""
-        Retrieve all currently active polls across the platform.
-        
-        **Returns:**
-        - List of all active (non-expired) polls
-        - Public polls available for voting
-        - Complete poll information with options
-        - Real-time vote counts
-        
-        **Filtering:**
-        - Only returns polls that haven't expired
-        - Includes polls from all users
-        - Ordered by creation date (newest first)
-        
-        **Public Endpoint:**
-        - No authentication required
-        - Perfect for browse/discovery functionality
-        """,
-        responses={
-            200: openapi.Response(
-                description="Active polls retrieved successfully", 
-                examples={
-                    "application/json": [
-                        {
-                            "poll_id": "550e8400-e29b-41d4-a716-446655440000",
-                            "title": "Best Frontend Framework 2025",
-                            "question": "Which frontend framework would you recommend?",
-                            "description": "Community poll for trending technologies",
-                            "created_by": {
-                                "user_id": "456e7890-e89b-12d3-a456-426614174001",
-                                "username": "developer_pro",
-                                "first_name": "Alex",
-                                "last_name": "Chen",
-                                "email": "alex@example.com",
-                                "full_name": "Alex Chen"
-                            },
-                            "created_at": "2025-09-20T14:30:00Z",
-                            "updated_at": "2025-09-25T10:15:00Z",
-                            "expires_at": "2025-10-31T23:59:59Z",
-                            "options": [
-                                {
-                                    "option_id": "opt-101",
-                                    "option_text": "React",
-                                    "vote_count": 58,
-                                    "created_at": "2025-09-20T14:30:00Z"
-                                },
-                                {
-                                    "option_id": "opt-102",
-                                    "option_text": "Vue.js",
-                                    "vote_count": 42,
-                                    "created_at": "2025-09-20T14:30:00Z"
-                                }
-                            ],
-                            "total_votes": 100,
-                            "is_active": True
-                        }
-                    ]
-                }
-            ),
-            500: openapi.Response(
-                description="Server error",
-                examples={
-                    "application/json": {
-                        "detail": "Internal server error"
-                    }
-                }
-            )
-        },
-        tags=['Polls - User Collections']
-    )
     def active_polls(self, request):
         """Get all active polls"""
-        from django.utils import timezone
-        active_polls = Poll.objects.filter(
-            models.Q(expires_at__isnull=True) | models.Q(expires_at__gt=timezone.now())
-        )
-        serializer = PollSerializer(active_polls, many=True)
-        return Response(serializer.data)
+        etag, body = get_or_render_active_polls(self._render_active_polls)
+        if client_has_etag(request, etag):
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            # Already JSON: skip DRF's renderer rather than decode and re-encode it
+            response = HttpResponse(body, content_type='application/json')
+        response['ETag'] = etag
+        return response
+
+    def _render_active_polls(self, chunk_size=POLL_CHUNK_SIZE):
+        """
+        Encode the active poll list one chunk at a time and splice the JSON
+        arrays together, so only one chunk of row dicts is alive at once.
+        The bytes match rendering the whole list in one go.
+        """
+        renderer = ORJSONRenderer()
+        parts = [renderer.render(chunk)[1:-1] for chunk in self._iter_active_polls(chunk_size)]
+        return b'[' + b','.join(parts) + b']'
+
+    def _iter_active_polls(self, chunk_size):
+        """
+        Yield the active polls in chunks of plain dicts built straight from
+        values_list() rows, in the same shape as PollListSerializer but without
+        instantiating models or serializer fields. This is the busiest public
+        listing, so it skips DRF; the JSON renderer handles UUIDs/datetimes.
+        """
+        rows = Poll.objects.filter(
+            Q(expires_at__isnull=True) | Q(expires_at__gt=Now())
+        ).annotate(total_votes=Count('votes')).order_by('-created_at').values_list(
+            'poll_id', 'title', 'question', 'created_at', 'updated_at',
+            'expires_at', 'total_votes', 'created_by__user_id', 'created_by__first_name',
+            'created_by__last_name', 'created_by__email', 'created_by__username'
+        ).iterator(chunk_size=chunk_size)
+        # A handful of users tend to own most polls: build each creator's
+        # dict once and share it between their polls
+        creators = {}
+        while chunk := list(islice(rows, chunk_size)):
+            # One options query per chunk, grouped by poll in Python
+            options = {row[0]: [] for row in chunk}
+            option_rows = Option.objects.filter(poll_id__in=options).annotate(
+                vote_count=Count('votes')
+            ).order_by('created_at').values_list(
+                'poll_id', 'option_id', 'option_text', 'vote_count', 'created_at'
+            )
+            for poll_id, option_id, option_text, vote_count, created_at in option_rows:
+                options[poll_id].append({
+                    'option_id': option_id,
+                    'option_text': option_text,
+                    'vote_count': vote_count,
+                    'created_at': created_at
+                })
+            polls = []
+            for (poll_id, title, question, created_at, updated_at, expires_at,
+                 total_votes, user_id, first_name, last_name, email, username) in chunk:
+                creator = creators.get(user_id)
+                if creator is None:
+                    creator = creators[user_id] = {
+                        'user_id': str(user_id),
+                        'first_name': first_name,
+                        'last_name': last_name,
+                        'full_name': f'{first_name} {last_name}',
+                        'email': email,
+                        'username': username,
+                    }
+                polls.append({
+                    'poll_id': poll_id,
+                    'title': title,
+                    'question': question,
+                    'created_by': creator,
+                    'created_at': created_at,
+                    'updated_at': updated_at,
+                    'expires_at': expires_at,
+                    'options': options[poll_id],
+                    'total_votes': total_votes,
+                    'is_active': True
+                })
+            yield polls
 
 class OptionViewSet(viewsets.ModelViewSet):
     """
@@ -878,155 +421,51 @@ class OptionViewSet(viewsets.ModelViewSet):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        queryset = Option.objects.all()
+        queryset = Option.objects.annotate(vote_count=Count('votes'))
+        if self.action in ['list', 'retrieve']:
+            # Read paths render OptionSerializer only; writes keep full rows so
+            # save() still refreshes updated_at
+            queryset = queryset.only('option_id', 'option_text', 'created_at')
+        elif self.action in ['update', 'partial_update', 'destroy']:
+            # The ownership check reads the poll's creator; join it in
+            queryset = queryset.select_related('poll').only(
+                'option_id', 'poll', 'option_text', 'created_at', 'updated_at', 'poll__created_by'
+            )
         poll_id = self.request.query_params.get('poll', None)
         if poll_id:
-            queryset = queryset.filter(poll_id=poll_id)
+            try:
+                queryset = queryset.filter(poll_id=uuid.UUID(poll_id))
+            except ValueError:
+                # Not a UUID, so no poll can match; skip the query entirely
+                return Option.objects.none()
         return queryset
+
+    def get_serializer_class(self):
+        if self.action in ['create', 'update', 'partial_update']:
+            return OptionWriteSerializer
+        return OptionSerializer
     
     def perform_create(self, serializer):
         poll = serializer.validated_data['poll']
-        if poll.created_by != self.request.user:
+        if poll.created_by_id != self.request.user.pk:
             raise serializers.ValidationError("You can only add options to your own polls")
         serializer.save()
 
-    @swagger_auto_schema(
-        operation_id="list_options",
-        operation_summary="List Poll Options",
-        operation_description="""
-        Retrieve all poll options, optionally filtered by poll.
-        
-        **Query Parameters:**
-        - `poll`: UUID of poll to filter options by
-        
-        **Returns:**
-        - List of options with vote counts
-        - Option IDs and text content
-        - Associated poll information
-        - Creation timestamps
-        
-        **Authentication Required:**
-        - Only authenticated users can access
-        """,
-        manual_parameters=[
-            openapi.Parameter(
-                'poll',
-                openapi.IN_QUERY,
-                description="Filter options by poll UUID",
-                type=openapi.TYPE_STRING,
-                format=openapi.FORMAT_UUID
-            )
-        ],
-        responses={
-            200: openapi.Response(
-                description="Options retrieved successfully",
-                examples={
-                    "application/json": [
-                        {
-                            "option_id": "opt-101",
-                            "option_text": "React",
-                            "vote_count": 45,
-                            "poll": "550e8400-e29b-41d4-a716-446655440000",
-                            "created_at": "2025-09-20T14:30:00Z"
-                        },
-                        {
-                            "option_id": "opt-102",
-                            "option_text": "Vue.js",
-                            "vote_count": 32,
-                            "poll": "550e8400-e29b-41d4-a716-446655440000",
-                            "created_at": "2025-09-20T14:30:00Z"
-                        }
-                    ]
-                }
-            ),
-            401: openapi.Response(
-                description="Authentication required",
-                examples={
-                    "application/json": {
-                        "detail": "Authentication credentials were not provided."
-                    }
-                }
-            )
-        },
-        tags=['Options - Management']
-    )
+    def check_poll_owner(self, option):
+        if option.poll.created_by_id != self.request.user.pk:
+            raise PermissionDenied("You can only change options of your own polls")
+
+    def perform_update(self, serializer):
+        self.check_poll_owner(serializer.instance)
+        serializer.save()
+
+    def perform_destroy(self, instance):
+        self.check_poll_owner(instance)
+        instance.delete()
+
+    # Overridden so polls.schemas attaches its docs to this class, not the shared mixins
     def list(self, request, *args, **kwargs):
         return super().list(request, *args, **kwargs)
 
-    @swagger_auto_schema(
-        operation_id="create_option",
-        operation_summary="Create Poll Option",
-        operation_description="""
-        Create a new option for a specific poll.
-        
-        **Requirements:**
-        - Must be authenticated
-        - Must be the poll owner
-        - Poll must exist and be active
-        - Option text must be unique within the poll
-        
-        **Process:**
-        1. Validates user owns the specified poll
-        2. Checks option text uniqueness
-        3. Creates option with zero votes
-        4. Returns created option data
-        """,
-        request_body=openapi.Schema(
-            type=openapi.TYPE_OBJECT,
-            required=['option_text', 'poll'],
-            properties={
-                'option_text': openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    description='Text content for the option (max 255 characters)',
-                    example='TypeScript'
-                ),
-                'poll': openapi.Schema(
-                    type=openapi.TYPE_STRING,
-                    format=openapi.FORMAT_UUID,
-                    description='UUID of the poll this option belongs to',
-                    example='550e8400-e29b-41d4-a716-446655440000'
-                )
-            },
-        ),
-        responses={
-            201: openapi.Response(
-                description="Option created successfully",
-                examples={
-                    "application/json": {
-                        "option_id": "opt-105",
-                        "option_text": "TypeScript",
-                        "vote_count": 0,
-                        "poll": "550e8400-e29b-41d4-a716-446655440000",
-                        "created_at": "2025-09-26T17:00:00Z"
-                    }
-                }
-            ),
-            400: openapi.Response(
-                description="Validation error",
-                examples={
-                    "application/json": {
-                        "detail": "You can only add options to your own polls"
-                    }
-                }
-            ),
-            401: openapi.Response(
-                description="Authentication required",
-                examples={
-                    "application/json": {
-                        "detail": "Authentication credentials were not provided."
-                    }
-                }
-            ),
-            404: openapi.Response(
-                description="Poll not found",
-                examples={
-                    "application/json": {
-                        "detail": "Poll not found."
-                    }
-                }
-            )
-        },
-        tags=['Options - Management']
-    )
     def create(self, request, *args, **kwargs):
         return super().create(request, *args, **kwargs)
\ No newline at end of file
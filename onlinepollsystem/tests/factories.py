@@ -1,28 +1,50 @@
+from functools import lru_cache
+
 import factory
+from django.contrib.auth.hashers import make_password
+from rest_framework.authtoken.models import Token
 from users.models import User  # Import directly instead of get_user_model()
 from polls.models import Poll, Option
 from votes.models import Vote
 
-class UserFactory(factory.django.DjangoModelFactory):
+@lru_cache(maxsize=None)
+def hashed_password(raw_password):
+    # Hashing is deliberately slow; every user sharing a password can share its hash
+    return make_password(raw_password)
+
+class BulkCreateMixin:
+    @classmethod
+    def create_batch_fast(cls, size, **kwargs):
+        """
+        Build ``size`` objects and insert them with one bulk_create. Skips
+        save() signals, so pass saved related objects (e.g. ``created_by``)
+        rather than relying on SubFactory defaults.
+        """
+        return cls._meta.model.objects.bulk_create(cls.build_batch(size, **kwargs))
+
+def create_tokens(users):
+    """Insert an auth token for each saved user with one bulk_create"""
+    # bulk_create skips Token.save(), which is what normally generates the key
+    return Token.objects.bulk_create([Token(user=user, key=Token.generate_key()) for user in users])
+
+class UserFactory(BulkCreateMixin, factory.django.DjangoModelFactory):
     class Meta:
         model = User
-        django_get_or_create = ('email',)
 
     username = factory.Sequence(lambda n: f'user{n}')
     first_name = factory.Faker('first_name')
     last_name = factory.Faker('last_name')
     email = factory.Sequence(lambda n: f'user{n}@example.com')
     is_active = True
+    password = 'password123'
 
-    @factory.post_generation
-    def password(self, create, extracted, **kwargs):
-        if not create:
-            return
-        password = extracted or 'password123'
-        self.set_password(password)
-        self.save()
+    @classmethod
+    def _adjust_kwargs(cls, **kwargs):
+        # Store the hash on the initial INSERT instead of set_password() plus a second save()
+        kwargs['password'] = hashed_password(kwargs['password'])
+        return kwargs
 
-class PollFactory(factory.django.DjangoModelFactory):
+class PollFactory(BulkCreateMixin, factory.django.DjangoModelFactory):
     class Meta:
         model = Poll
     
@@ -30,11 +52,12 @@ class PollFactory(factory.django.DjangoModelFactory):
     description = factory.Faker('text', max_nb_chars=200)
     created_by = factory.SubFactory(UserFactory)
 
-class OptionFactory(factory.django.DjangoModelFactory):
+class OptionFactory(BulkCreateMixin, factory.django.DjangoModelFactory):
     class Meta:
         model = Option
     
-    option_text = factory.Faker('word')
+    # Unique per poll, unlike Faker words
+    option_text = factory.Sequence(lambda n: f'Choice {n}')
     poll = factory.SubFactory(PollFactory)
 
 class VoteFactory(factory.django.DjangoModelFactory):
@@ -43,16 +66,13 @@ class VoteFactory(factory.django.DjangoModelFactory):
     
     user = factory.SubFactory(UserFactory)
     poll = factory.SubFactory(PollFactory)
-    option = factory.SubFactory(OptionFactory)
+    # The default option belongs to the vote's poll rather than a poll of its own
+    option = factory.SubFactory(OptionFactory, poll=factory.SelfAttribute('..poll'))
 
     @classmethod
-    def _create(cls, model_class, *args, **kwargs):
-        # Ensure the option belongs to the poll
-        if 'poll' in kwargs and 'option' not in kwargs:
-            poll = kwargs['poll']
-            option = OptionFactory(poll=poll)
-            kwargs['option'] = option
-        elif 'option' in kwargs and 'poll' not in kwargs:
-            kwargs['poll'] = kwargs['option'].poll
-            
-        return super()._create(model_class, *args, **kwargs)
\ No newline at end of file
+    def _generate(cls, strategy, params):
+        # Sub-factories are resolved before _create runs, so derive the poll from a
+        # given option up front instead of letting PollFactory build a spare one
+        if 'option' in params and 'poll' not in params:
+            params['poll'] = params['option'].poll
+        return super()._generate(strategy, params)
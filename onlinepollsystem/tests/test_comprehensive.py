@@ -1,13 +1,21 @@
 import pytest
-from rest_framework.test import APIClient
-from rest_framework import status
+import factory
+from rest_framework import serializers, status
 from rest_framework.authtoken.models import Token
+from rest_framework.exceptions import ValidationError
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
 from datetime import timedelta
-from tests.factories import UserFactory, PollFactory, OptionFactory
+from tests.factories import UserFactory, PollFactory, OptionFactory, VoteFactory, create_tokens
 from polls.models import Poll, Option
 from votes.models import Vote
+from polls.cache import poll_cache_key
+from polls.serializers import AddOptionSerializer
+from users.cache import token_cache_key
+from users.serializers import UserRegistrationSerializer, UserSerializer
 
 User = get_user_model()
 
@@ -15,9 +23,10 @@ User = get_user_model()
 class TestUserAuthenticationAPI:
     """Comprehensive tests for authentication endpoints at /api/v1/auth/"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, api_client):
         """Setup method called before each test"""
-        self.client = APIClient()
+        self.client = api_client
         self.user_data = {
             'first_name': 'John',
             'last_name': 'Doe',
@@ -57,6 +66,18 @@ class TestUserAuthenticationAPI:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'username' in response.data
 
+    def test_user_registration_email_taken_after_validation(self):
+        """Test a signup that loses the race for its email after validation"""
+        serializer = UserRegistrationSerializer(data=self.user_data)
+        assert serializer.is_valid()
+        UserFactory(email=self.user_data['email'], username='different_user')
+        
+        with pytest.raises(ValidationError) as exc_info:
+            serializer.save()
+        
+        assert 'email' in exc_info.value.detail
+        assert not User.objects.filter(username=self.user_data['username']).exists()
+
     def test_user_registration_password_mismatch(self):
         """Test registration with mismatched passwords"""
         data = self.user_data.copy()
@@ -163,6 +184,8 @@ class TestUserAuthenticationAPI:
         assert 'message' in response.data
         # Token should be deleted
         assert not Token.objects.filter(user=user).exists()
+        # ...and no longer accepted, even though the last request cached it
+        assert self.client.get('/api/v1/users/profile/').status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_user_logout_without_authentication(self):
         """Test logout without authentication"""
@@ -175,12 +198,13 @@ class TestUserAuthenticationAPI:
 class TestUserManagementAPI:
     """Comprehensive tests for user management endpoints at /api/v1/users/"""
     
-    def setup_method(self):
-        """Setup method called before each test"""
-        self.client = APIClient()
-        self.user = UserFactory()
-        self.token, created = Token.objects.get_or_create(user=self.user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+    @pytest.fixture(autouse=True)
+    def setup(self, class_user, api_client):
+        """Authenticate as the user shared by this class's tests"""
+        user_id, token_key = class_user
+        self.client = api_client
+        self.user = User.objects.get(pk=user_id)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token_key}')
 
     def test_get_user_profile(self):
         """Test getting user profile via /api/v1/users/profile/"""
@@ -191,6 +215,51 @@ class TestUserManagementAPI:
         assert response.data['email'] == self.user.email
         assert response.data['username'] == self.user.username
 
+    def test_get_user_profile_after_update(self):
+        """Test the cached profile is dropped when the profile changes"""
+        self.client.get('/api/v1/users/profile/')
+        self.client.patch('/api/v1/users/update_profile/', {'first_name': 'Renamed'}, format='json')
+        
+        response = self.client.get('/api/v1/users/profile/')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['first_name'] == 'Renamed'
+
+    def test_retrieve_other_user_not_cached_for_non_staff(self, class_user, admin_user, admin_token):
+        """Test a user cached for an admin is still hidden from other users"""
+        user_id, token_key = class_user
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {admin_token}')
+        assert self.client.get(f'/api/v1/users/{admin_user.user_id}/').status_code == status.HTTP_200_OK
+        
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token_key}')
+        response = self.client.get(f'/api/v1/users/{admin_user.user_id}/')
+        
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+
+    def test_update_profile_unchanged_skips_write(self):
+        """Test a PATCH that repeats the current values writes nothing"""
+        updated_data = {'first_name': self.user.first_name, 'email': self.user.email}
+        
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.patch('/api/v1/users/update_profile/', updated_data, format='json')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert not [q for q in queries if q['sql'].startswith('UPDATE')]
+
+    def test_update_user_by_id(self, admin_token):
+        """Test users can update their own account by id, but not anyone else's"""
+        url = f'/api/v1/users/{self.user.user_id}/'
+        response = self.client.patch(url, {'first_name': 'Renamed'}, format='json')
+        assert response.status_code == status.HTTP_200_OK
+        
+        # Even staff may not edit another user's account
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {admin_token}')
+        response = self.client.patch(url, {'first_name': 'Hijacked'}, format='json')
+        
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        self.user.refresh_from_db()
+        assert self.user.first_name == 'Renamed'
+
     def test_get_user_profile_unauthenticated(self):
         """Test getting profile without authentication"""
         self.client.credentials()  # Remove authentication
@@ -312,12 +381,34 @@ class TestUserManagementAPI:
         
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
-    def test_get_voting_history(self):
-        """Test getting user's voting history"""
-        response = self.client.get('/api/v1/users/voting_history/')
+    @pytest.mark.max_queries(3)
+    def test_get_voting_history(self, max_queries):
+        """Test voting history does not query per vote for the poll and option"""
+        for poll in PollFactory.create_batch(10):
+            option, _ = OptionFactory.create_batch(2, poll=poll)
+            VoteFactory(poll=poll, option=option, user=self.user)
+        
+        with max_queries():
+            response = self.client.get('/api/v1/users/voting_history/')
         
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert response.data['count'] == 10
+        for vote in response.data['results']:
+            poll = Poll.objects.get(pk=vote['poll_id'])
+            assert vote['poll_title'] == poll.title
+            assert vote['option_text'] == Option.objects.get(pk=vote['option_id']).option_text
+            assert vote['user_username'] == self.user.username
+        # The raw rows render exactly like the votes list's serializer output
+        rendered = {vote['vote_id']: vote for vote in response.json()['results']}
+        listed = self.client.get('/api/v1/votes/').json()['results']
+        assert rendered == {vote['vote_id']: vote for vote in listed}
+
+    def test_token_cache_holds_no_credentials(self):
+        """Test the auth cache stores only the user's id and active flag"""
+        token_key = Token.objects.get(user=self.user).key
+        self.client.get('/api/v1/users/profile/')
+        
+        assert cache.get(token_cache_key(token_key)) == (self.user.pk, True)
 
     def test_deactivate_account(self):
         """Test account deactivation"""
@@ -329,6 +420,9 @@ class TestUserManagementAPI:
         # Verify account was deactivated
         self.user.refresh_from_db()
         assert not self.user.is_active
+        assert not Token.objects.filter(user=self.user).exists()
+        # The token cached by the previous request must stop working at once
+        assert self.client.get('/api/v1/users/profile/').status_code == status.HTTP_401_UNAUTHORIZED
 
     def test_all_users_admin_required(self):
         """Test that all_users endpoint requires admin privileges"""
@@ -336,52 +430,146 @@ class TestUserManagementAPI:
         
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_all_users_admin_success(self):
+    @pytest.mark.max_queries(3)
+    def test_all_users_admin_success(self, max_queries, admin_token):
         """Test admin can access all users"""
-        admin_user = UserFactory(is_staff=True, is_superuser=True)
-        admin_token, created = Token.objects.get_or_create(user=admin_user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {admin_token.key}')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {admin_token}')
+        UserFactory.create_batch_fast(10)
+        
+        with max_queries():
+            response = self.client.get('/api/v1/users/all_users/')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert isinstance(response.data['results'], list)
+        assert response.data['count'] >= 2  # At least our test user and admin user
+
+    def test_all_users_rows_match_field_rendering(self, admin_user, admin_token):
+        """Test the flat user rendering matches DRF's field-by-field output"""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {admin_token}')
         
         response = self.client.get('/api/v1/users/all_users/')
         
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
-        assert len(response.data) >= 2  # At least our test user and admin user
+        rows = {row['user_id']: row for row in response.data['results']}
+        expected = serializers.ModelSerializer.to_representation(UserSerializer(), self.user)
+        assert rows[str(self.user.user_id)] == expected
+
+    def test_delete_user_not_found(self, admin_token):
+        """Test deleting an unknown user ID returns 404"""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {admin_token}')
+        user = UserFactory()
+        user_id = user.user_id
+        user.delete()
+
+        response = self.client.delete(f'/api/v1/users/{user_id}/delete_user/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data['error'] == 'User not found'
+
+    def test_delete_user_malformed_id(self, admin_token):
+        """Test a user ID that is not a UUID returns 404 rather than an error"""
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {admin_token}')
+
+        response = self.client.delete('/api/v1/users/not-a-uuid/delete_user/')
+
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.data['error'] == 'User not found'
 
 
 @pytest.mark.django_db
 class TestPollAPI:
     """Comprehensive tests for poll management at /api/v1/polls/"""
     
-    def setup_method(self):
-        """Setup method called before each test"""
-        self.client = APIClient()
-        self.user = UserFactory()
-        self.token, created = Token.objects.get_or_create(user=self.user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+    @pytest.fixture(autouse=True)
+    def setup(self, class_user, api_client):
+        """Authenticate as the user shared by this class's tests"""
+        user_id, token_key = class_user
+        self.client = api_client
+        self.user = User.objects.get(pk=user_id)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token_key}')
 
-    def test_list_polls_anonymous(self):
+    @pytest.mark.max_queries(3)
+    def test_list_polls_anonymous(self, max_queries):
         """Test listing polls without authentication (should work)"""
         self.client.credentials()  # Remove authentication
-        PollFactory.create_batch(3)
+        PollFactory.create_batch_fast(10, created_by=UserFactory())
         
-        response = self.client.get('/api/v1/polls/')
+        with max_queries():
+            response = self.client.get('/api/v1/polls/')
         
         assert response.status_code == status.HTTP_200_OK
         assert 'results' in response.data  # Paginated response
-        assert len(response.data['results']) == 3
+        assert len(response.data['results']) == 10
 
-    def test_list_polls_authenticated(self):
+    @pytest.mark.max_queries(5)
+    def test_list_polls_authenticated(self, max_queries):
         """Test listing polls with authentication"""
-        PollFactory.create_batch(3)
+        PollFactory.create_batch_fast(10, created_by=self.user)
         
-        response = self.client.get('/api/v1/polls/')
+        with max_queries():
+            response = self.client.get('/api/v1/polls/')
         
         assert response.status_code == status.HTTP_200_OK
         assert 'results' in response.data  # Paginated response
-        assert len(response.data['results']) == 3
+        assert len(response.data['results']) == 10
+
+    @pytest.mark.max_queries(5)
+    def test_list_polls_query_count(self, max_queries):
+        """Test poll list query count does not grow with polls, options or votes"""
+        for poll in PollFactory.create_batch_fast(5, created_by=self.user):
+            for option in OptionFactory.create_batch_fast(3, poll=poll):
+                VoteFactory(poll=poll, option=option)
+        
+        with max_queries():
+            response = self.client.get('/api/v1/polls/')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 5
+        assert all(poll['total_votes'] == 3 for poll in response.data['results'])
+
+    def test_list_polls_omit_description(self):
+        """Test poll listings leave out the description that the detail view returns"""
+        poll = PollFactory(created_by=self.user, description='Long text')
+
+        for url in ('/api/v1/polls/', '/api/v1/polls/my_polls/'):
+            response = self.client.get(url)
+            assert 'description' not in response.data['results'][0]
+        response = self.client.get('/api/v1/polls/active_polls/')
+        assert 'description' not in response.json()[0]
+
+        response = self.client.get(f'/api/v1/polls/{poll.poll_id}/')
+        assert response.data['description'] == 'Long text'
+
+    def test_list_polls_active_filter(self):
+        """Test the active query parameter filters the poll list"""
+        PollFactory(title='Open', expires_at=None)
+        PollFactory(title='Closed', expires_at=timezone.now() - timedelta(days=1))
+        
+        response = self.client.get('/api/v1/polls/', {'active': 'true'})
+        assert [poll['title'] for poll in response.data['results']] == ['Open']
+        
+        response = self.client.get('/api/v1/polls/', {'active': 'false'})
+        assert [poll['title'] for poll in response.data['results']] == ['Closed']
+
+    def test_list_polls_cursor_pagination(self):
+        """Test poll list pages newest first via cursor links"""
+        polls = PollFactory.create_batch(25)
 
-    def test_create_poll_success(self):
+        response = self.client.get('/api/v1/polls/')
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 20
+        assert 'cursor=' in response.data['next']
+
+        next_page = self.client.get(response.data['next'])
+        assert len(next_page.data['results']) == 5
+        assert next_page.data['next'] is None
+
+        listed = [poll['poll_id'] for poll in response.data['results'] + next_page.data['results']]
+        newest_first = sorted(polls, key=lambda poll: poll.created_at, reverse=True)
+        assert listed == [str(poll.poll_id) for poll in newest_first]
+
+    @pytest.mark.max_queries(5)
+    def test_create_poll_success(self, max_queries):
         """Test successful poll creation"""
         poll_data = {
             'title': 'Test Poll',
@@ -395,10 +583,12 @@ class TestPollAPI:
             ]
         }
         
-        response = self.client.post('/api/v1/polls/', poll_data, format='json')
+        with max_queries():
+            response = self.client.post('/api/v1/polls/', poll_data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert response.data['title'] == poll_data['title']
+        assert [option['option_text'] for option in response.data['options']] == ['Option 1', 'Option 2', 'Option 3']
         assert response.data['created_by']['user_id'] == str(self.user.user_id)
         
         # Verify poll was created in database
@@ -420,6 +610,23 @@ class TestPollAPI:
         
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
+    def test_create_poll_duplicate_options(self):
+        """Test poll creation with repeated option texts"""
+        poll_data = {
+            'title': 'Duplicate Options Poll',
+            'question': 'Pick one',
+            'options': [
+                {'option_text': 'Same'},
+                {'option_text': 'Same'}
+            ]
+        }
+        
+        response = self.client.post('/api/v1/polls/', poll_data, format='json')
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'options' in response.data
+        assert not Poll.objects.filter(title=poll_data['title']).exists()
+
     def test_retrieve_poll(self):
         """Test retrieving a specific poll"""
         poll = PollFactory(created_by=self.user)
@@ -444,6 +651,33 @@ class TestPollAPI:
         assert response.status_code == status.HTTP_200_OK
         assert response.data['title'] == updated_data['title']
 
+    @pytest.mark.max_queries(5)
+    @pytest.mark.parametrize('method', ['patch', 'put'])
+    def test_update_poll_query_count(self, max_queries, method):
+        """Test an update response does not count votes once per option"""
+        poll = PollFactory(created_by=self.user)
+        options = OptionFactory.create_batch(6, poll=poll)
+        VoteFactory(poll=poll, option=options[0])
+        data = {'title': 'Updated', 'question': 'Still a question?'}
+        
+        with max_queries():
+            response = getattr(self.client, method)(f'/api/v1/polls/{poll.poll_id}/', data, format='json')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['title'] == 'Updated'
+        assert [option['vote_count'] for option in response.data['options']] == [1, 0, 0, 0, 0, 0]
+
+    def test_update_poll_expiry_reports_is_active(self):
+        """Test the update response reflects a newly set expiry"""
+        poll = PollFactory(created_by=self.user, expires_at=None)
+        expired = (timezone.now() - timedelta(days=1)).isoformat()
+        
+        response = self.client.patch(f'/api/v1/polls/{poll.poll_id}/', {'expires_at': expired}, format='json')
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['is_active'] is False
+        assert self.client.get(f'/api/v1/polls/{poll.poll_id}/').data['is_active'] is False
+
     def test_update_poll_non_owner(self):
         """Test updating poll by non-owner"""
         other_user = UserFactory()
@@ -468,25 +702,96 @@ class TestPollAPI:
         assert response.status_code == status.HTTP_204_NO_CONTENT
         assert not Poll.objects.filter(poll_id=poll_id).exists()
 
-    def test_poll_results(self):
+    @pytest.mark.max_queries(1)
+    def test_poll_results(self, max_queries):
         """Test getting poll results"""
         poll = PollFactory(created_by=self.user)
-        option1 = OptionFactory(poll=poll, option_text='Option 1')
-        option2 = OptionFactory(poll=poll, option_text='Option 2')
+        option1, option2 = OptionFactory.create_batch_fast(2, poll=poll)
         
         # Create some votes
-        voter1 = UserFactory()
-        voter2 = UserFactory()
-        Vote.objects.create(poll=poll, option=option1, user=voter1)
-        Vote.objects.create(poll=poll, option=option2, user=voter2)
+        voter1, voter2 = UserFactory.create_batch_fast(2)
+        Vote.objects.bulk_create([
+            Vote(poll=poll, option=option1, user=voter1),
+            Vote(poll=poll, option=option2, user=voter2),
+        ])
         
         response = self.client.get(f'/api/v1/polls/{poll.poll_id}/results/')
         
         assert response.status_code == status.HTTP_200_OK
         assert 'results' in response.data
         assert response.data['total_votes'] == 2
+        
+        # Repeat reads are served from the results cache; the auth cache leaves
+        # only the requesting user's primary-key read
+        with max_queries():
+            cached = self.client.get(f'/api/v1/polls/{poll.poll_id}/results/')
+        assert cached.data == response.data
+
+    def test_poll_results_refresh_after_vote(self):
+        """Test cached poll results are invalidated when a vote is cast"""
+        poll = PollFactory()
+        option = OptionFactory(poll=poll)
+        
+        response = self.client.get(f'/api/v1/polls/{poll.poll_id}/results/')
+        assert response.data['total_votes'] == 0
+        
+        self.client.post(f'/api/v1/polls/{poll.poll_id}/vote/', {'option_id': str(option.option_id)}, format='json')
+        
+        response = self.client.get(f'/api/v1/polls/{poll.poll_id}/results/')
+        assert response.data['total_votes'] == 1
+        assert response.data['results'][0]['votes'] == 1
+
+    def test_poll_cache_cleared_again_on_commit(self, django_capture_on_commit_callbacks):
+        """Test a cache refill made before the write commits is dropped at commit"""
+        poll = PollFactory()
+        option = OptionFactory(poll=poll)
+        key = poll_cache_key(poll.poll_id, 'results')
+        
+        with django_capture_on_commit_callbacks() as callbacks:
+            VoteFactory(poll=poll, option=option)
+            # Another connection, not yet seeing the vote, caches stale results
+            cache.set(key, 'stale')
+        assert cache.get(key) == 'stale'
+        
+        for callback in callbacks:
+            callback()
+        assert cache.get(key) is None
+
+    def test_poll_results_conditional_get(self):
+        """Test poll results honour If-None-Match until a vote changes them"""
+        poll = PollFactory()
+        option = OptionFactory(poll=poll)
+        url = f'/api/v1/polls/{poll.poll_id}/results/'
+        
+        etag = self.client.get(url)['ETag']
+        
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        
+        Vote.objects.create(poll=poll, option=option, user=self.user)
+        
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_200_OK
+        assert response['ETag'] != etag
+
+    def test_poll_results_gzipped_conditional_get(self):
+        """Test gzipped responses carry a weak ETag that still revalidates"""
+        PollFactory.create_batch_fast(5, created_by=self.user)
+        response = self.client.get('/api/v1/polls/', HTTP_ACCEPT_ENCODING='gzip')
+        assert response['Content-Encoding'] == 'gzip'
+
+        poll = PollFactory()
+        OptionFactory.create_batch(3, poll=poll)
+        url = f'/api/v1/polls/{poll.poll_id}/results/'
+
+        etag = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip')['ETag']
+        assert etag.startswith('W/')
+
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=etag)
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
 
-    def test_cast_vote_success(self):
+    @pytest.mark.max_queries(6)
+    def test_cast_vote_success(self, max_queries):
         """Test successfully casting a vote"""
         poll = PollFactory()
         option = OptionFactory(poll=poll)
@@ -495,7 +800,8 @@ class TestPollAPI:
             'option_id': str(option.option_id)
         }
         
-        response = self.client.post(f'/api/v1/polls/{poll.poll_id}/vote/', vote_data, format='json')
+        with max_queries():
+            response = self.client.post(f'/api/v1/polls/{poll.poll_id}/vote/', vote_data, format='json')
         
         assert response.status_code == status.HTTP_201_CREATED
         assert 'message' in response.data
@@ -503,6 +809,20 @@ class TestPollAPI:
         # Verify vote was recorded
         assert Vote.objects.filter(poll=poll, user=self.user, option=option).exists()
 
+    def test_cast_vote_returns_counts(self):
+        """Test the vote response carries the updated tallies"""
+        poll = PollFactory()
+        option, other_option = OptionFactory.create_batch(2, poll=poll)
+        VoteFactory(poll=poll, option=option)
+        VoteFactory(poll=poll, option=other_option)
+        
+        response = self.client.post(f'/api/v1/polls/{poll.poll_id}/vote/', {'option_id': str(option.option_id)}, format='json')
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['option_voted']['option_id'] == option.option_id
+        assert response.data['option_voted']['vote_count'] == 2
+        assert response.data['total_votes'] == 3
+
     def test_cast_duplicate_vote(self):
         """Test casting vote on same poll twice"""
         poll = PollFactory()
@@ -534,6 +854,20 @@ class TestPollAPI:
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'error' in response.data
 
+    def test_vote_invalid_option_or_poll(self):
+        """Test voting with another poll's option or on a missing poll"""
+        poll = PollFactory()
+        other_option = OptionFactory()
+        vote_data = {'option_id': str(other_option.option_id)}
+
+        response = self.client.post(f'/api/v1/polls/{poll.poll_id}/vote/', vote_data, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'option_id' in response.data
+
+        response = self.client.post(f'/api/v1/polls/{other_option.option_id}/vote/', vote_data, format='json')
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert not Vote.objects.exists()
+
     def test_get_poll_options(self):
         """Test getting poll options"""
         poll = PollFactory()
@@ -546,6 +880,80 @@ class TestPollAPI:
         assert isinstance(response.data, list)
         assert len(response.data) == 2
 
+    @pytest.mark.max_queries(3)
+    def test_list_options_filtered_by_poll(self, max_queries):
+        """Test listing options for one poll through the options endpoint"""
+        poll = PollFactory()
+        option = OptionFactory(poll=poll)
+        OptionFactory(poll=poll)
+        OptionFactory()
+        VoteFactory(poll=poll, option=option)
+        
+        with max_queries():
+            response = self.client.get('/api/v1/options/', {'poll': str(poll.poll_id)})
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert len(response.data['results']) == 2
+        assert sorted(option['vote_count'] for option in response.data['results']) == [0, 1]
+
+    @pytest.mark.max_queries(4)
+    def test_create_option_via_options_endpoint(self, max_queries):
+        """Test creating options through the options endpoint checks poll ownership"""
+        poll = PollFactory(created_by=self.user)
+        
+        with max_queries():
+            response = self.client.post('/api/v1/options/', {'poll': str(poll.poll_id), 'option_text': 'Mine'}, format='json')
+        
+        assert response.status_code == status.HTTP_201_CREATED
+        assert response.data['vote_count'] == 0
+        
+        other_poll = PollFactory()
+        response = self.client.post('/api/v1/options/', {'poll': str(other_poll.poll_id), 'option_text': 'Theirs'}, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not Option.objects.filter(poll=other_poll).exists()
+
+    def test_update_option_cannot_move_poll(self):
+        """Test an option's poll cannot be changed through the options endpoint"""
+        poll = PollFactory(created_by=self.user)
+        option = OptionFactory(poll=poll, option_text='Before')
+        other_poll = PollFactory(created_by=self.user)
+        
+        response = self.client.patch(
+            f'/api/v1/options/{option.option_id}/',
+            {'poll': str(other_poll.poll_id), 'option_text': 'After'},
+            format='json'
+        )
+        
+        assert response.status_code == status.HTTP_200_OK
+        option.refresh_from_db()
+        assert option.poll_id == poll.poll_id
+        assert option.option_text == 'After'
+
+    def test_update_or_delete_other_users_option(self):
+        """Test only the poll owner can update or delete its options"""
+        option = OptionFactory(option_text='Theirs')
+        my_poll = PollFactory(created_by=self.user)
+        url = f'/api/v1/options/{option.option_id}/'
+        
+        response = self.client.patch(url, {'poll': str(my_poll.poll_id), 'option_text': 'Mine'}, format='json')
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        
+        response = self.client.delete(url)
+        assert response.status_code == status.HTTP_403_FORBIDDEN
+        
+        option.refresh_from_db()
+        assert option.option_text == 'Theirs'
+        assert option.poll_id != my_poll.poll_id
+
+    def test_list_options_invalid_poll_filter(self):
+        """Test a malformed poll filter matches nothing instead of erroring"""
+        OptionFactory()
+        
+        response = self.client.get('/api/v1/options/', {'poll': 'not-a-uuid'})
+        
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data['results'] == []
+
     def test_add_option_to_poll_owner(self):
         """Test adding option to poll by owner"""
         poll = PollFactory(created_by=self.user)
@@ -562,6 +970,17 @@ class TestPollAPI:
         # Verify option was added
         assert Option.objects.filter(poll=poll, option_text=option_data['option_text']).exists()
 
+    def test_add_duplicate_option(self):
+        """Test adding an option whose text the poll already has"""
+        poll = PollFactory(created_by=self.user)
+        OptionFactory(poll=poll, option_text='Taken')
+        
+        response = self.client.post(f'/api/v1/polls/{poll.poll_id}/add_option/', {'option_text': 'Taken'}, format='json')
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'option_text' in response.data
+        assert Option.objects.filter(poll=poll).count() == 1
+
     def test_add_option_to_poll_non_owner(self):
         """Test adding option to poll by non-owner"""
         other_user = UserFactory()
@@ -575,25 +994,99 @@ class TestPollAPI:
         
         assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_get_my_polls(self):
+    @pytest.mark.max_queries(7)
+    def test_add_options_bulk(self, max_queries):
+        """Test adding several options to a poll in one request"""
+        poll = PollFactory(created_by=self.user)
+        OptionFactory(poll=poll, option_text='Existing')
+        url = f'/api/v1/polls/{poll.poll_id}/add_options/'
+
+        with max_queries():
+            response = self.client.post(url, {'options': [{'option_text': f'Option {i}'} for i in range(10)]}, format='json')
+
+        assert response.status_code == status.HTTP_201_CREATED
+        assert Option.objects.filter(poll=poll).count() == 11
+
+        response = self.client.post(url, {'options': [{'option_text': 'Existing'}]}, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+        response = self.client.post(url, {'options': [{'option_text': 'Twice'}, {'option_text': 'Twice'}]}, format='json')
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert Option.objects.filter(poll=poll).count() == 11
+
+    def test_add_options_text_added_concurrently(self, monkeypatch):
+        """Test a text that slips past the existing-texts check fails the whole batch"""
+        poll = PollFactory(created_by=self.user)
+        OptionFactory(poll=poll, option_text='Raced')
+        # As if 'Raced' was inserted after add_options read the poll's texts
+        monkeypatch.setattr(AddOptionSerializer, 'validate_option_text', lambda self, value: value)
+        
+        response = self.client.post(
+            f'/api/v1/polls/{poll.poll_id}/add_options/',
+            {'options': [{'option_text': 'Fresh'}, {'option_text': 'Raced'}]},
+            format='json'
+        )
+        
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+        assert 'options' in response.data
+        assert list(Option.objects.filter(poll=poll).values_list('option_text', flat=True)) == ['Raced']
+
+    @pytest.mark.max_queries(5)
+    def test_get_my_polls(self, max_queries):
         """Test getting user's own polls"""
         # Create polls by this user and other users
-        my_poll1 = PollFactory(created_by=self.user, title='My Poll 1')
-        my_poll2 = PollFactory(created_by=self.user, title='My Poll 2')
+        Poll.objects.bulk_create([
+            PollFactory.build(created_by=self.user, title='My Poll 1'),
+            PollFactory.build(created_by=self.user, title='My Poll 2'),
+        ])
         other_poll = PollFactory(title='Other Poll')
         
-        response = self.client.get('/api/v1/polls/my_polls/')
+        with max_queries():
+            response = self.client.get('/api/v1/polls/my_polls/')
         
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
-        assert len(response.data) == 2
+        assert isinstance(response.data['results'], list)
+        assert len(response.data['results']) == 2
         
-        poll_titles = [poll['title'] for poll in response.data]
+        poll_titles = [poll['title'] for poll in response.data['results']]
         assert 'My Poll 1' in poll_titles
         assert 'My Poll 2' in poll_titles
         assert 'Other Poll' not in poll_titles
 
-    def test_get_active_polls(self):
+    @pytest.mark.max_queries(5)
+    def test_user_collections_query_count(self, max_queries):
+        """Test my_polls and active_polls query counts do not grow with polls, options or votes"""
+        for poll in PollFactory.create_batch(5, created_by=self.user):
+            for option in OptionFactory.create_batch(3, poll=poll):
+                VoteFactory(poll=poll, option=option)
+        
+        for url in ('/api/v1/polls/my_polls/', '/api/v1/polls/active_polls/'):
+            with max_queries():
+                response = self.client.get(url)
+            assert response.status_code == status.HTTP_200_OK
+        
+        assert len(response.json()) == 5
+        assert all(len(poll['options']) == 3 for poll in response.json())
+
+    def test_active_polls_refresh_after_change(self):
+        """Test the cached active poll list picks up new polls and votes"""
+        poll = PollFactory()
+        option = OptionFactory(poll=poll)
+        url = '/api/v1/polls/active_polls/'
+        
+        etag = self.client.get(url)['ETag']
+        assert self.client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == status.HTTP_304_NOT_MODIFIED
+        
+        Vote.objects.create(poll=poll, option=option, user=self.user)
+        response = self.client.get(url)
+        assert response.json()[0]['total_votes'] == 1
+        
+        PollFactory(title='Newer Poll')
+        response = self.client.get(url)
+        assert [poll['title'] for poll in response.json()][0] == 'Newer Poll'
+
+    @pytest.mark.max_queries(3)
+    def test_get_active_polls(self, max_queries):
         """Test getting active polls"""
         # Create active and expired polls
         active_poll = PollFactory(
@@ -609,12 +1102,13 @@ class TestPollAPI:
             expires_at=None
         )
         
-        response = self.client.get('/api/v1/polls/active_polls/')
+        with max_queries():
+            response = self.client.get('/api/v1/polls/active_polls/')
         
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert isinstance(response.json(), list)
         
-        poll_titles = [poll['title'] for poll in response.data]
+        poll_titles = [poll['title'] for poll in response.json()]
         assert 'Active Poll' in poll_titles
         assert 'No Expiry Poll' in poll_titles
         # Expired poll should not be in results (this depends on implementation)
@@ -624,27 +1118,29 @@ class TestPollAPI:
 class TestVoteAPI:
     """Comprehensive tests for voting endpoints at /api/v1/votes/"""
     
-    def setup_method(self):
-        """Setup method called before each test"""
-        self.client = APIClient()
-        self.user = UserFactory()
-        self.token, created = Token.objects.get_or_create(user=self.user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {self.token.key}')
+    @pytest.fixture(autouse=True)
+    def setup(self, class_user, api_client):
+        """Authenticate as the user shared by this class's tests"""
+        user_id, token_key = class_user
+        self.client = api_client
+        self.user = User.objects.get(pk=user_id)
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token_key}')
 
     def test_list_user_votes(self):
         """Test listing user's votes"""
-        # Create some votes for this user
-        poll1 = PollFactory()
-        poll2 = PollFactory()
-        option1 = OptionFactory(poll=poll1)
-        option2 = OptionFactory(poll=poll2)
-        
-        vote1 = Vote.objects.create(poll=poll1, option=option1, user=self.user)
-        vote2 = Vote.objects.create(poll=poll2, option=option2, user=self.user)
-        
-        # Create a vote by another user (should not appear)
         other_user = UserFactory()
-        other_vote = Vote.objects.create(poll=poll1, option=option1, user=other_user)
+        poll1, poll2 = PollFactory.create_batch_fast(2, created_by=other_user)
+        option1, option2 = Option.objects.bulk_create(
+            [OptionFactory.build(poll=poll1), OptionFactory.build(poll=poll2)]
+        )
+        
+        Vote.objects.bulk_create([
+            # Votes for this user
+            Vote(poll=poll1, option=option1, user=self.user),
+            Vote(poll=poll2, option=option2, user=self.user),
+            # A vote by another user (should not appear)
+            Vote(poll=poll1, option=option1, user=other_user),
+        ])
         
         response = self.client.get('/api/v1/votes/')
         
@@ -654,7 +1150,26 @@ class TestVoteAPI:
         
         # Verify votes belong to current user
         for vote in response.data['results']:
-            assert vote['user']['user_id'] == str(self.user.user_id)
+            assert vote['user_username'] == self.user.username
+        assert {vote['poll_id'] for vote in response.data['results']} == {
+            str(poll1.poll_id), str(poll2.poll_id)
+        }
+
+    @pytest.mark.max_queries(3)
+    def test_list_user_votes_query_count(self, max_queries):
+        """Test listing votes does not query per vote for the poll and option"""
+        for poll in PollFactory.create_batch(5):
+            option, _ = OptionFactory.create_batch(2, poll=poll)
+            Vote.objects.create(poll=poll, option=option, user=self.user)
+            VoteFactory(poll=poll, option=option)
+        
+        with max_queries():
+            response = self.client.get('/api/v1/votes/')
+        
+        assert len(response.data['results']) == 5
+        assert all(set(vote) == {
+            'vote_id', 'poll_id', 'poll_title', 'option_id', 'option_text', 'user_username', 'timestamp'
+        } for vote in response.data['results'])
 
     def test_retrieve_specific_vote(self):
         """Test retrieving a specific vote"""
@@ -693,9 +1208,10 @@ class TestVoteAPI:
 class TestIntegrationWorkflows:
     """End-to-end integration tests combining authentication, polls, and voting"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, api_client):
         """Setup method called before each test"""
-        self.client = APIClient()
+        self.client = api_client
 
     def test_complete_user_poll_vote_workflow(self):
         """Test complete workflow: register -> login -> create poll -> vote -> check results"""
@@ -764,7 +1280,7 @@ class TestIntegrationWorkflows:
         # 8. Check user's voting history
         history_response = self.client.get('/api/v1/users/voting_history/')
         assert history_response.status_code == status.HTTP_200_OK
-        assert len(history_response.data) == 1
+        assert len(history_response.data['results']) == 1
         
         # 9. Check user's votes via votes endpoint
         votes_response = self.client.get('/api/v1/votes/')
@@ -778,48 +1294,29 @@ class TestIntegrationWorkflows:
     def test_multi_user_poll_voting(self):
         """Test multiple users voting on the same poll"""
         
-        # Create poll creator
-        creator = UserFactory()
-        creator_token, _ = Token.objects.get_or_create(user=creator)
-        
-        # Create voters
-        voter1 = UserFactory()
-        voter2 = UserFactory()
-        voter1_token, _ = Token.objects.get_or_create(user=voter1)
-        voter2_token, _ = Token.objects.get_or_create(user=voter2)
-        
-        # Creator creates a poll
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {creator_token.key}')
-        poll_data = {
-            'title': 'Multi-user Test Poll',
-            'question': 'What is your favorite programming language?',
-            'description': 'Testing multiple users voting',
-            'options': [
-                {'option_text': 'Python'},
-                {'option_text': 'JavaScript'},
-                {'option_text': 'Java'}
-            ]
-        }
+        # Create the poll creator and two voters; only the voters need tokens
+        creator, voter1, voter2 = UserFactory.create_batch_fast(3)
+        voter1_token, voter2_token = create_tokens([voter1, voter2])
         
-        poll_response = self.client.post('/api/v1/polls/', poll_data, format='json')
-        assert poll_response.status_code == status.HTTP_201_CREATED
-        poll_id = poll_response.data['poll_id']
-        
-        # Get options
-        options_response = self.client.get(f'/api/v1/polls/{poll_id}/options/')
-        options = options_response.data
+        # The creator's poll comes straight from the factories; poll creation
+        # over the API is covered by test_complete_user_poll_vote_workflow
+        poll = PollFactory(created_by=creator, title='Multi-user Test Poll')
+        options = OptionFactory.create_batch_fast(
+            3, poll=poll, option_text=factory.Iterator(['Python', 'JavaScript', 'Java'])
+        )
+        poll_id = poll.poll_id
         
         # Voter 1 votes for Python
         self.client.credentials(HTTP_AUTHORIZATION=f'Token {voter1_token.key}')
         vote_response1 = self.client.post(f'/api/v1/polls/{poll_id}/vote/', {
-            'option_id': options[0]['option_id']  # Python
+            'option_id': str(options[0].option_id)  # Python
         }, format='json')
         assert vote_response1.status_code == status.HTTP_201_CREATED
         
         # Voter 2 votes for JavaScript
         self.client.credentials(HTTP_AUTHORIZATION=f'Token {voter2_token.key}')
         vote_response2 = self.client.post(f'/api/v1/polls/{poll_id}/vote/', {
-            'option_id': options[1]['option_id']  # JavaScript
+            'option_id': str(options[1].option_id)  # JavaScript
         }, format='json')
         assert vote_response2.status_code == status.HTTP_201_CREATED
         
@@ -830,31 +1327,23 @@ class TestIntegrationWorkflows:
         assert results_response.data['total_votes'] == 2
         
         # Check that each option has correct vote counts
-        results = results_response.data['results']
-        python_option = next(r for r in results if r['option_text'] == 'Python')
-        javascript_option = next(r for r in results if r['option_text'] == 'JavaScript')
-        java_option = next(r for r in results if r['option_text'] == 'Java')
-        
-        assert python_option['votes'] == 1
-        assert javascript_option['votes'] == 1
-        assert java_option['votes'] == 0
+        votes_by_text = {r['option_text']: r['votes'] for r in results_response.data['results']}
+        assert votes_by_text == {'Python': 1, 'JavaScript': 1, 'Java': 0}
 
-    def test_admin_user_management_workflow(self):
+    def test_admin_user_management_workflow(self, admin_user, admin_token):
         """Test admin user management capabilities"""
         
-        # Create admin user
-        admin_user = UserFactory(is_staff=True, is_superuser=True)
-        admin_token, _ = Token.objects.get_or_create(user=admin_user)
-        
-        # Create regular users
-        user1 = UserFactory(first_name='User', last_name='One')
-        user2 = UserFactory(first_name='User', last_name='Two')
+        # Create two regular users; the admin is seeded for the session
+        user1, user2 = User.objects.bulk_create([
+            UserFactory.build(first_name='User', last_name='One'),
+            UserFactory.build(first_name='User', last_name='Two'),
+        ])
         
         # Admin gets all users
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {admin_token.key}')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {admin_token}')
         all_users_response = self.client.get('/api/v1/users/all_users/')
         assert all_users_response.status_code == status.HTTP_200_OK
-        assert len(all_users_response.data) >= 3  # admin + 2 regular users
+        assert all_users_response.data['count'] >= 3  # admin + 2 regular users
         
         # Admin deletes a user
         delete_response = self.client.delete(f'/api/v1/users/{user1.user_id}/delete_user/')
@@ -1,17 +1,17 @@
 import pytest
-from rest_framework.test import APIClient
 from rest_framework import status
 from rest_framework.authtoken.models import Token
 from users.models import User
-from tests.factories import UserFactory
+from tests.factories import UserFactory, create_tokens
 
 @pytest.mark.django_db
 class TestUserAuthenticationAPI:
     """Test class for User Authentication endpoints at /api/v1/auth/"""
     
-    def setup_method(self):
+    @pytest.fixture(autouse=True)
+    def setup(self, api_client):
         """Setup method called before each test"""
-        self.client = APIClient()
+        self.client = api_client
         self.user_data = {
             'first_name': 'John',
             'last_name': 'Doe',
@@ -25,17 +25,11 @@ class TestUserAuthenticationAPI:
         """Test user registration endpoint"""
         response = self.client.post('/api/v1/auth/register/', self.user_data, format='json')
         
-        print(f"Registration Response Status: {response.status_code}")
-        print(f"Registration Response Data: {response.data}")
-        
         # Check if registration was successful
         if response.status_code == status.HTTP_201_CREATED:
             assert 'user' in response.data
             assert response.data['user']['email'] == self.user_data['email']
             assert response.data['user']['username'] == self.user_data['username']
-        else:
-            # Print error details for debugging
-            print(f"Registration failed: {response.data}")
 
     def test_user_login(self):
         """Test user login endpoint"""
@@ -55,15 +49,10 @@ class TestUserAuthenticationAPI:
         
         response = self.client.post('/api/v1/auth/login/', login_data, format='json')
         
-        print(f"Login Response Status: {response.status_code}")
-        print(f"Login Response Data: {response.data}")
-        
         # Check if login was successful
         if response.status_code == status.HTTP_200_OK:
             assert 'token' in response.data
             assert 'user' in response.data
-        else:
-            print(f"Login failed: {response.data}")
 
     def test_user_logout(self):
         """Test user logout endpoint"""
@@ -74,24 +63,16 @@ class TestUserAuthenticationAPI:
         
         response = self.client.post('/api/v1/auth/logout/')
         
-        print(f"Logout Response Status: {response.status_code}")
-        print(f"Logout Response Data: {response.data}")
-        
         # Logout should return 200
         assert response.status_code == status.HTTP_200_OK
 
-    def test_get_user_profile(self):
+    def test_get_user_profile(self, authenticated_client):
         """Test get user profile endpoint - Using ViewSet action"""
-        # Create user and authenticate
-        user = UserFactory()
-        token, created = Token.objects.get_or_create(user=user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        # Read-only, so the session's seeded user will do
+        client, user = authenticated_client
         
         # Based on your UserViewSet, the profile endpoint is an action
-        response = self.client.get('/api/v1/users/profile/')
-        
-        print(f"Profile Response Status: {response.status_code}")
-        print(f"Profile Response Data: {response.data}")
+        response = client.get('/api/v1/users/profile/')
         
         assert response.status_code == status.HTTP_200_OK
         assert 'email' in response.data
@@ -112,9 +93,6 @@ class TestUserAuthenticationAPI:
         # Based on your UserViewSet, update_profile is a custom action
         response = self.client.patch('/api/v1/users/update_profile/', updated_data, format='json')
         
-        print(f"Update Profile Response Status: {response.status_code}")
-        print(f"Update Profile Response Data: {response.data}")
-        
         assert response.status_code == status.HTTP_200_OK
         assert 'user' in response.data
         assert response.data['user']['first_name'] == updated_data['first_name']
@@ -143,9 +121,6 @@ class TestUserAuthenticationAPI:
         
         response = self.client.post('/api/v1/users/change_password/', password_data, format='json')
         
-        print(f"Change Password Response Status: {response.status_code}")
-        print(f"Change Password Response Data: {response.data}")
-        
         assert response.status_code == status.HTTP_200_OK
         assert 'message' in response.data
         assert response.data['message'] == 'Password changed successfully'
@@ -154,21 +129,16 @@ class TestUserAuthenticationAPI:
         user.refresh_from_db()
         assert user.check_password('newpassword123')
 
-    def test_get_voting_history(self):
+    def test_get_voting_history(self, authenticated_client):
         """Test get user's voting history endpoint"""
-        # Create user and authenticate
-        user = UserFactory()
-        token, created = Token.objects.get_or_create(user=user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
+        # Read-only, so the session's seeded user will do
+        client, user = authenticated_client
         
         # Based on your UserViewSet, voting_history is a custom action
-        response = self.client.get('/api/v1/users/voting_history/')
-        
-        print(f"Voting History Response Status: {response.status_code}")
-        print(f"Voting History Response Data: {response.data}")
+        response = client.get('/api/v1/users/voting_history/')
         
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert isinstance(response.data['results'], list)
 
     def test_deactivate_account(self):
         """Test deactivate account endpoint"""
@@ -180,9 +150,6 @@ class TestUserAuthenticationAPI:
         # Based on your UserViewSet, deactivate_account is a custom action with DELETE method
         response = self.client.delete('/api/v1/users/deactivate_account/')
         
-        print(f"Deactivate Account Response Status: {response.status_code}")
-        print(f"Deactivate Account Response Data: {response.data}")
-        
         assert response.status_code == status.HTTP_200_OK
         assert 'message' in response.data
         
@@ -202,9 +169,6 @@ class TestUserAuthenticationAPI:
         
         response = self.client.post('/api/v1/auth/register/', invalid_data, format='json')
         
-        print(f"Invalid Registration Response Status: {response.status_code}")
-        print(f"Invalid Registration Response Data: {response.data}")
-        
         # Should return 400 Bad Request
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
@@ -220,9 +184,6 @@ class TestUserAuthenticationAPI:
         
         response = self.client.post('/api/v1/auth/login/', login_data, format='json')
         
-        print(f"Invalid Login Response Status: {response.status_code}")
-        print(f"Invalid Login Response Data: {response.data}")
-        
         # Should return 400 Bad Request
         assert response.status_code == status.HTTP_400_BAD_REQUEST
 
@@ -230,9 +191,6 @@ class TestUserAuthenticationAPI:
         """Test accessing profile without authentication"""
         response = self.client.get('/api/v1/users/profile/')
         
-        print(f"Unauthenticated Profile Response Status: {response.status_code}")
-        print(f"Unauthenticated Profile Response Data: {response.data}")
-        
         # Should return 401 Unauthorized
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
 
@@ -250,14 +208,11 @@ class TestUserAuthenticationAPI:
         
         response = self.client.post('/api/v1/users/change_password/', password_data, format='json')
         
-        print(f"Wrong Old Password Response Status: {response.status_code}")
-        print(f"Wrong Old Password Response Data: {response.data}")
-        
         # Should return 400 Bad Request
         assert response.status_code == status.HTTP_400_BAD_REQUEST
         assert 'old_password' in response.data
 
-    def test_list_all_users_admin_only(self):
+    def test_list_all_users_admin_only(self, admin_token):
         """Test listing all users - Admin only endpoint"""
         # Create regular user
         user = UserFactory()
@@ -267,70 +222,35 @@ class TestUserAuthenticationAPI:
         # Try to access admin endpoint
         response = self.client.get('/api/v1/users/all_users/')
         
-        print(f"All Users (Regular User) Response Status: {response.status_code}")
-        print(f"All Users (Regular User) Response Data: {response.data}")
-        
         # Should return 403 Forbidden for regular user
         assert response.status_code == status.HTTP_403_FORBIDDEN
         
         # Now test with admin user
-        admin_user = UserFactory(is_staff=True, is_superuser=True)
-        admin_token, created = Token.objects.get_or_create(user=admin_user)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {admin_token.key}')
+        self.client.credentials(HTTP_AUTHORIZATION=f'Token {admin_token}')
         
         response = self.client.get('/api/v1/users/all_users/')
         
-        print(f"All Users (Admin) Response Status: {response.status_code}")
-        print(f"All Users (Admin) Response Data: {response.data}")
-        
         # Should return 200 OK for admin user
         assert response.status_code == status.HTTP_200_OK
-        assert isinstance(response.data, list)
+        assert isinstance(response.data['results'], list)
 
-    def test_update_profile_with_duplicate_email(self):
-        """Test updating profile with email that already exists"""
+    @pytest.mark.parametrize('field', ['email', 'username'])
+    def test_update_profile_with_duplicate_value(self, field):
+        """Test updating profile with an email or username that already exists"""
         # Create two users
-        user1 = UserFactory(email='user1@example.com')
-        user2 = UserFactory(email='user2@example.com')
+        user1, user2 = UserFactory.create_batch_fast(2)
         
         # Authenticate as user1
-        token, created = Token.objects.get_or_create(user=user1)
+        token, = create_tokens([user1])
         self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
         
-        # Try to update user1's email to user2's email
+        # Try to update user1's field to user2's value
         updated_data = {
-            'email': 'user2@example.com'  # This should fail
+            field: getattr(user2, field)  # This should fail
         }
         
         response = self.client.patch('/api/v1/users/update_profile/', updated_data, format='json')
         
-        print(f"Duplicate Email Update Response Status: {response.status_code}")
-        print(f"Duplicate Email Update Response Data: {response.data}")
-        
-        # Should return 400 Bad Request due to duplicate email
-        assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'email' in response.data
-
-    def test_update_profile_with_duplicate_username(self):
-        """Test updating profile with username that already exists"""
-        # Create two users
-        user1 = UserFactory(username='user1')
-        user2 = UserFactory(username='user2')
-        
-        # Authenticate as user1
-        token, created = Token.objects.get_or_create(user=user1)
-        self.client.credentials(HTTP_AUTHORIZATION=f'Token {token.key}')
-        
-        # Try to update user1's username to user2's username
-        updated_data = {
-            'username': 'user2'  # This should fail
-        }
-        
-        response = self.client.patch('/api/v1/users/update_profile/', updated_data, format='json')
-        
-        print(f"Duplicate Username Update Response Status: {response.status_code}")
-        print(f"Duplicate Username Update Response Data: {response.data}")
-        
-        # Should return 400 Bad Request due to duplicate username
+        # Should return 400 Bad Request due to the duplicate
         assert response.status_code == status.HTTP_400_BAD_REQUEST
-        assert 'username' in response.data
\ No newline at end of file
+        assert field in response.data
\ No newline at end of file
@@ -0,0 +1,40 @@
+from django.core.cache import cache
+from rest_framework import exceptions
+from rest_framework.authentication import TokenAuthentication
+
+from .cache import TOKEN_CACHE_TIMEOUT, invalidate_token_cache, token_cache_key
+from .models import User
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    TokenAuthentication that remembers which user a token belongs to, so
+    repeat requests with the same token skip the token/user join and read
+    the user by primary key instead.
+
+    Only ``(user_pk, is_active)`` is cached, under a hash of the key: the
+    raw token and the user's password hash never reach the cache. The user
+    row is still read on every request, so deactivation takes effect at
+    once. Deleting the token (logout) or saving its user drops the entry
+    (see users.signals), which only reaches every worker through a shared
+    cache; settings enables this class only when Redis is configured.
+    """
+
+    def authenticate_credentials(self, key):
+        cache_key = token_cache_key(key)
+        cached = cache.get(cache_key)
+        if cached is None:
+            user, token = super().authenticate_credentials(key)
+            cache.set(cache_key, (user.pk, user.is_active), TOKEN_CACHE_TIMEOUT)
+            return user, token
+
+        user_pk, is_active = cached
+        try:
+            user = User.objects.get(pk=user_pk) if is_active else None
+        except User.DoesNotExist:
+            user = None
+        if user is None or not user.is_active:
+            invalidate_token_cache(key)
+            raise exceptions.AuthenticationFailed('User inactive or deleted.')
+        # The token row itself was checked when the entry was cached
+        return user, self.get_model()(key=key, user=user)
@@ -0,0 +1,37 @@
+import hashlib
+import uuid
+
+from django.core.cache import cache
+
+from onlinepollsystem.cache import delete_now_and_on_commit
+
+# Seconds a serialized user is served for; saves and deletes drop it sooner
+USER_CACHE_TIMEOUT = 300
+
+# Seconds an auth token is trusted without re-reading it and its user
+TOKEN_CACHE_TIMEOUT = 60
+
+
+def user_cache_key(user_id):
+    return f'user:{uuid.UUID(str(user_id))}'
+
+
+def get_or_build(user_id, build):
+    """
+    Return the serialized user, calling build() and caching its result on
+    a miss. Nothing is cached if build() raises (e.g. Http404).
+    """
+    return cache.get_or_set(user_cache_key(user_id), build, USER_CACHE_TIMEOUT)
+
+
+def invalidate_user_cache(user_id):
+    delete_now_and_on_commit([user_cache_key(user_id)])
+
+
+def token_cache_key(key):
+    # Hashed so raw tokens never appear as cache keys (e.g. in Redis)
+    return 'auth:token:' + hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
+
+def invalidate_token_cache(key):
+    delete_now_and_on_commit([token_cache_key(key)])
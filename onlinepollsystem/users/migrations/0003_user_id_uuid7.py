@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-15 23:16
+
+import users.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('users', '0002_user_is_superuser'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='user',
+            name='user_id',
+            field=models.UUIDField(default=users.models.uuid7, editable=False, primary_key=True, serialize=False),
+        ),
+    ]
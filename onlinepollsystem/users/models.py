@@ -1,3 +1,5 @@
+import os
+import time
 import uuid
 from django.db import models
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin
@@ -5,6 +7,19 @@ from django.contrib.auth.models import BaseUserManager
 
 # Create your models here.
 
+def uuid7():
+    """
+    Time-ordered UUID (RFC 9562 version 7) for primary keys.
+
+    Keys sort by creation time, so new rows append to the right edge of the
+    primary key index instead of splitting random pages like ``uuid4`` does.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), 'big')
+    value = value & ~(0xF << 76) | 0x7 << 76
+    value = value & ~(0x3 << 62) | 0x2 << 62
+    return uuid.UUID(int=value)
+
+
 class UserManager(BaseUserManager):
     """Custom user manager"""
     
@@ -38,7 +53,7 @@ class User(AbstractBaseUser, PermissionsMixin):
         - full_name: Property that returns the full name of the user.
         - get_short_name: Returns the short name (username) of the user.
     """
-    user_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    user_id = models.UUIDField(primary_key=True, default=uuid7, editable=False)
     first_name = models.CharField(max_length=255, blank=False, null=False)
     last_name = models.CharField(max_length=255, blank=False, null=False)
     email = models.EmailField(unique=True, null=False, blank=False)
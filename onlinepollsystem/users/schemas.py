@@ -0,0 +1,442 @@
+"""
+OpenAPI overrides for the user and authentication views.
+
+Like polls.schemas, these are only attached when the Swagger URLconf is
+loaded, so requests never pay for building the schema objects.
+"""
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+
+from .serializers import (
+    UserSerializer,
+    UserRegistrationSerializer,
+    UserLoginSerializer,
+    UserUpdateSerializer,
+    ChangePasswordSerializer,
+    UserRegistrationResponseSerializer,
+    UserLoginResponseSerializer,
+    UserProfileUpdateResponseSerializer,
+    PaginatedUserResponseSerializer,
+    PasswordChangeResponseSerializer,
+    ErrorResponseSerializer
+)
+from .views import UserLoginView, UserLogoutView, UserRegistrationView, UserViewSet
+
+_registered = False
+
+
+def register():
+    """Attach the swagger_auto_schema overrides to the view methods (once)."""
+    global _registered
+    if _registered:
+        return
+    _registered = True
+
+    swagger_auto_schema(
+        operation_id="register_user",
+        operation_summary="Register New User Account",
+        operation_description="""
+        Register a new user account with email verification.
+
+        **Password Requirements:**
+        - Minimum 8 characters
+        - Mix of letters, numbers, and special characters
+        - Cannot be too similar to personal information
+        - Cannot be a commonly used password
+
+        **Returns:**
+        - User profile data
+        - Authentication token for immediate login
+        """,
+        request_body=UserRegistrationSerializer,
+        responses={
+            201: openapi.Response(
+                description="User registered successfully",
+                schema=UserRegistrationResponseSerializer,
+                examples={
+                    "application/json": {
+                        "message": "User registered successfully",
+                        "user": {
+                            "user_id": "123e4567-e89b-12d3-a456-426614174000",
+                            "first_name": "John",
+                            "last_name": "Doe",
+                            "email": "john.doe@example.com",
+                            "username": "johndoe",
+                            "full_name": "John Doe",
+                            "date_joined": "2024-01-15T10:30:00Z"
+                        },
+                        "token": "9944b09199c62bcf9418ad846dd0e4bbdfc6ee4b"
+                    }
+                }
+            ),
+            400: openapi.Response(
+                description="Validation error",
+                schema=ErrorResponseSerializer,
+                examples={
+                    "application/json": {
+                        "email": ["User with this email already exists."],
+                        "username": ["This username is already taken."],
+                        "password": ["This password is too weak."],
+                        "password_confirm": ["Passwords don't match."]
+                    }
+                }
+            )
+        },
+        tags=['Authentication']
+    )(UserRegistrationView.post)
+
+    swagger_auto_schema(
+        operation_id="login_user",
+        operation_summary="User Login",
+        operation_description="""
+        Authenticate user with email and password credentials.
+
+        **Authentication Process:**
+        1. Validates email format
+        2. Checks if user exists and is active
+        3. Verifies password hash
+        4. Generates/retrieves authentication token
+        5. Creates login session
+
+        **Returns:**
+        - User profile information
+        - Authentication token for API requests
+        """,
+        request_body=UserLoginSerializer,
+        responses={
+            200: openapi.Response(
+                description="Login successful",
+                schema=UserLoginResponseSerializer,
+                examples={
+                    "application/json": {
+                        "message": "Login successful",
+                        "user": {
+                            "user_id": "123e4567-e89b-12d3-a456-426614174000",
+                            "first_name": "John",
+                            "last_name": "Doe", 
+                            "email": "john.doe@example.com",
+                            "username": "johndoe",
+                            "full_name": "John Doe"
+                        },
+                        "token": "9944b09199c62bcf9418ad846dd0e4bbdfc6ee4b"
+                    }
+                }
+            ),
+            400: openapi.Response(
+                description="Invalid credentials",
+                schema=ErrorResponseSerializer,
+                examples={
+                    "application/json": {
+                        "non_field_errors": ["Invalid email or password"]
+                    }
+                }
+            )
+        },
+        tags=['Authentication']
+    )(UserLoginView.post)
+
+    swagger_auto_schema(
+        operation_id="logout_user",
+        operation_summary="User Logout",
+        operation_description="""
+        Logout the current authenticated user.
+
+        **Process:**
+        1. Validates authentication token
+        2. Deletes user's authentication token
+        3. Clears login session
+        4. Invalidates API access
+
+        **Security:**
+        - Prevents token reuse
+        - Clears server-side session data
+        - Requires valid token to logout
+        """,
+        manual_parameters=[
+            openapi.Parameter(
+                'Authorization',
+                openapi.IN_HEADER,
+                description="Token your_auth_token",
+                type=openapi.TYPE_STRING,
+                required=True
+            )
+        ],
+        responses={
+            200: openapi.Response(
+                description="Logout successful",
+                examples={
+                    "application/json": {
+                        "message": "Logout successful"
+                    }
+                }
+            ),
+            401: "Authentication required"
+        },
+        tags=['Authentication']
+    )(UserLogoutView.post)
+
+    swagger_auto_schema(
+        operation_id="get_user_profile",
+        operation_summary="Get Current User Profile",
+        operation_description="""
+        Retrieve the authenticated user's complete profile information.
+
+        **Returns:**
+        - Complete user profile data
+        - Read-only computed fields (full_name, etc.)
+        - Account timestamps
+        """,
+        responses={
+            200: openapi.Response(
+                description="Profile retrieved successfully",
+                schema=UserSerializer
+            ),
+            401: "Authentication required"
+        },
+        tags=['User Profile']
+    )(UserViewSet.profile)
+
+    swagger_auto_schema(
+        method='patch',
+        operation_id="update_user_profile_patch",
+        operation_summary="Update User Profile (Partial)",
+        operation_description="""
+        Partially update user profile information (PATCH method).
+
+        **Features:**
+        - Update only specified fields
+        - Email uniqueness validation
+        - Username uniqueness validation
+        - Permission validation (own profile only)
+
+        **Updatable Fields:**
+        - first_name
+        - last_name
+        - email (must be unique)
+        - username (must be unique)
+        """,
+        request_body=UserUpdateSerializer,
+        responses={
+            200: openapi.Response(
+                description="Profile updated successfully",
+                schema=UserProfileUpdateResponseSerializer,
+                examples={
+                    "application/json": {
+                        "message": "Profile updated successfully",
+                        "user": {
+                            "user_id": "123e4567-e89b-12d3-a456-426614174000",
+                            "first_name": "John Updated",
+                            "last_name": "Doe Updated",
+                            "email": "john.updated@example.com",
+                            "username": "johndoe_updated"
+                        }
+                    }
+                }
+            ),
+            400: openapi.Response(
+                description="Validation error",
+                examples={
+                    "application/json": {
+                        "email": ["This email address is already registered"],
+                        "username": ["This username is already taken"]
+                    }
+                }
+            ),
+            403: "Permission denied - Can only update own profile"
+        },
+        tags=['User Profile']
+    )(UserViewSet.update_profile)
+
+    swagger_auto_schema(
+        method='put',
+        operation_id="update_user_profile_put",
+        operation_summary="Update User Profile (Complete)",
+        operation_description="Update all user profile fields (PUT method)",
+        request_body=UserUpdateSerializer,
+        responses={
+            200: openapi.Response(
+                description="Profile updated successfully",
+                schema=UserProfileUpdateResponseSerializer
+            ),
+            400: "Validation error"
+        },
+        tags=['User Profile']
+    )(UserViewSet.update_profile)
+
+    swagger_auto_schema(
+        operation_id="change_user_password",
+        operation_summary="Change User Password",
+        operation_description="""
+        Change the authenticated user's password.
+
+        **Security Requirements:**
+        - Current password verification
+        - New password strength validation
+        - Password confirmation matching
+        - Automatic token refresh
+
+        **Process:**
+        1. Validates current password
+        2. Checks new password strength
+        3. Confirms password match
+        4. Updates password hash
+        5. Maintains current login session
+        """,
+        request_body=ChangePasswordSerializer,
+        responses={
+            200: openapi.Response(
+                description="Password changed successfully",
+                schema=PasswordChangeResponseSerializer,
+                examples={
+                    "application/json": {
+                        "message": "Password changed successfully"
+                    }
+                }
+            ),
+            400: openapi.Response(
+                description="Validation error",
+                examples={
+                    "application/json": {
+                        "old_password": ["Current password is incorrect"],
+                        "confirm_password": ["New passwords don't match"],
+                        "new_password": ["This password is too weak"]
+                    }
+                }
+            )
+        },
+        tags=['User Profile']
+    )(UserViewSet.change_password)
+
+    swagger_auto_schema(
+        operation_id="deactivate_user_account",
+        operation_summary="Deactivate User Account",
+        operation_description="""
+        Deactivate the current user's account (soft delete).
+
+        **Process:**
+        - Sets is_active = False
+        - Preserves user data for potential reactivation
+        - Prevents future logins
+        - Maintains data integrity
+
+        **Note:** This is a soft delete. Account can be reactivated by admin.
+        """,
+        responses={
+            200: openapi.Response(
+                description="Account deactivated successfully",
+                examples={
+                    "application/json": {
+                        "message": "Account deactivated successfully"
+                    }
+                }
+            )
+        },
+        tags=['User Profile']
+    )(UserViewSet.deactivate_account)
+
+    swagger_auto_schema(
+        operation_id="get_voting_history",
+        operation_summary="Get User's Voting History",
+        operation_description="""
+        Retrieve complete voting history for the authenticated user.
+
+        **Returns:**
+        - Paginated list of votes cast by user (use `?page=N`)
+        - Poll information for each vote
+        - Option details and timestamps
+        - Sorted by most recent first
+        """,
+        responses={
+            200: openapi.Response(
+                description="Voting history retrieved",
+                examples={
+                    "application/json": {
+                        "count": 1,
+                        "next": None,
+                        "previous": None,
+                        "results": [
+                            {
+                                "vote_id": "vote-uuid",
+                                "poll_id": "poll-uuid",
+                                "poll_title": "Best Programming Language",
+                                "option_id": "option-uuid",
+                                "option_text": "Python",
+                                "user_username": "johndoe",
+                                "timestamp": "2024-01-15T14:30:00Z"
+                            }
+                        ]
+                    }
+                }
+            )
+        },
+        tags=['User Profile']
+    )(UserViewSet.voting_history)
+
+    swagger_auto_schema(
+        operation_id="list_all_users",
+        operation_summary="List All Users (Admin Only)",
+        operation_description="""
+        Retrieve list of all users in the system.
+
+        **Admin Only:** Requires staff permissions.
+
+        **Returns:**
+        - Paginated list of all users, newest first (use `?page=N`)
+        - Full profile information
+        - Account status and timestamps
+        """,
+        responses={
+            200: openapi.Response(
+                description="Users retrieved successfully",
+                schema=PaginatedUserResponseSerializer
+            ),
+            403: "Admin access required"
+        },
+        tags=['Admin Operations']
+    )(UserViewSet.all_users)
+
+    swagger_auto_schema(
+        operation_id="delete_user_by_id",
+        operation_summary="Delete User by ID (Admin Only)",
+        operation_description="""
+        Permanently delete a user account by ID.
+
+        **Admin Only:** Requires staff permissions.
+        **Warning:** This is a permanent deletion.
+
+        **Process:**
+        1. Validates user existence
+        2. Performs hard delete
+        3. Removes all related data
+        4. Cannot be undone
+        """,
+        manual_parameters=[
+            openapi.Parameter(
+                'pk',
+                openapi.IN_PATH,
+                description="User ID (UUID)",
+                type=openapi.TYPE_STRING,
+                required=True
+            )
+        ],
+        responses={
+            200: openapi.Response(
+                description="User deleted successfully",
+                examples={
+                    "application/json": {
+                        "message": "User deleted successfully"
+                    }
+                }
+            ),
+            404: openapi.Response(
+                description="User not found",
+                examples={
+                    "application/json": {
+                        "error": "User not found"
+                    }
+                }
+            ),
+            403: "Admin access required"
+        },
+        tags=['Admin Operations']
+    )(UserViewSet.delete_user)
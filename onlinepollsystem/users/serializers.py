@@ -1,11 +1,15 @@
 from rest_framework import serializers
 from django.contrib.auth import authenticate
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from django.contrib.auth.password_validation import validate_password
 from django.contrib.auth.hashers import make_password, check_password
+from onlinepollsystem.serializers import CachedFieldsMixin
 from .models import User
 
 
-class UserRegistrationSerializer(serializers.ModelSerializer):
+class UserRegistrationSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     User Registration Serializer
     
@@ -37,7 +41,6 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
     """
     password = serializers.CharField(
         write_only=True,
-        validators=[validate_password],
         style={'input_type': 'password'},
         help_text="Password must be at least 8 characters long"
     )
@@ -51,9 +54,10 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         model = User
         fields = ('user_id', 'first_name', 'last_name', 'email', 'username', 'password', 'password_confirm')
         read_only_fields = ('user_id',)
+        # Uniqueness is checked in validate() with one query for both fields
         extra_kwargs = {
-            'email': {'help_text': 'Valid email address for account verification'},
-            'username': {'help_text': 'Unique username for login'},
+            'email': {'help_text': 'Valid email address for account verification', 'validators': []},
+            'username': {'help_text': 'Unique username for login', 'validators': []},
             'first_name': {'help_text': 'Your first name'},
             'last_name': {'help_text': 'Your last name'},
             'password': {'write_only': True},
@@ -61,7 +65,8 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
 
     def validate(self, attrs):
         """
-        Validate that both passwords match
+        Validate that both passwords match, that email and username are
+        free, and only then run the password strength validators
         
         Args:
             attrs (dict): Dictionary containing validated field data
@@ -70,15 +75,41 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
             dict: Validated data
             
         Raises:
-            ValidationError: If passwords don't match
+            ValidationError: If passwords don't match, email or username is
+                taken, or the password is too weak
         """
         if attrs['password'] != attrs['password_confirm']:
             raise serializers.ValidationError("Passwords don't match")
+        self._check_unique(attrs['email'], attrs['username'])
+        user = User(
+            first_name=attrs['first_name'],
+            last_name=attrs['last_name'],
+            email=attrs['email'],
+            username=attrs['username'],
+        )
+        try:
+            validate_password(attrs['password'], user=user)
+        except DjangoValidationError as exc:
+            raise serializers.ValidationError({'password': list(exc.messages)})
         return attrs
+
+    def _check_unique(self, email, username):
+        """Raise a per-field error if the email or username is already registered"""
+        errors = {}
+        taken = User.objects.filter(Q(email=email) | Q(username=username)).values_list('email', 'username')
+        for taken_email, taken_username in taken:
+            if taken_email == email:
+                errors['email'] = ["This email address is already registered"]
+            if taken_username == username:
+                errors['username'] = ["This username is already taken"]
+        if errors:
+            raise serializers.ValidationError(errors)
     
     def create(self, validated_data):
         """
-        Create a new user with hashed password
+        Create a new user with hashed password in a single INSERT. The
+        unique indexes on email and username are the final guard against
+        concurrent signups for the same values.
         
         Args:
             validated_data (dict): Validated user data
@@ -88,14 +119,22 @@ class UserRegistrationSerializer(serializers.ModelSerializer):
         """
         validated_data.pop('password_confirm', None)
         password = validated_data.pop('password')
-        user = User.objects.create(
+        user = User(
             first_name=validated_data.get('first_name'),
             last_name=validated_data.get('last_name'),
             email=validated_data.get('email'),
             username=validated_data.get('username')
         )
-        user.set_password(password)  # This properly hashes the password
-        user.save()
+        user.set_password(password)  # Hash before the INSERT so no UPDATE follows
+        try:
+            # Savepoint: a failed INSERT must not poison the request's transaction
+            with transaction.atomic():
+                user.save(force_insert=True)
+        except IntegrityError:
+            # Lost a race with a concurrent signup after validate() passed;
+            # report it against the field(s) like the pre-check would
+            self._check_unique(user.email, user.username)
+            raise
         return user
     
 class UserLoginSerializer(serializers.Serializer):
@@ -161,19 +200,17 @@ class UserLoginSerializer(serializers.Serializer):
         password = attrs.get('password')
 
         if email and password:
-            try:
-                user = User.objects.get(email=email, is_active=True)
-                if user.check_password(password):
-                    attrs['user'] = user
-                    return attrs
-                else:
-                    raise serializers.ValidationError(
-                        "Invalid credentials or inactive user."
-                    )
-            except User.DoesNotExist:
-                raise serializers.ValidationError(
-                    "Invalid credentials or inactive user."
-                )
+            user = User.objects.filter(email=email, is_active=True).first()
+            if user is None:
+                # Hash the password anyway, as ModelBackend does, so an unknown
+                # email costs the same as a wrong password
+                User().set_password(password)
+            elif user.check_password(password):
+                attrs['user'] = user
+                return attrs
+            raise serializers.ValidationError(
+                "Invalid credentials or inactive user."
+            )
         else:
             raise serializers.ValidationError(
                 "Must include 'email' and 'password'."
@@ -215,13 +252,49 @@ class UserSerializer(serializers.ModelSerializer):
             'updated_at': {'help_text': 'Last profile update timestamp'},
         }
 
+    def to_representation(self, instance):
+        """
+        Build the output directly from the instance's attributes instead of
+        dispatching through eight bound fields. Every user in a response
+        (profile, login, registration, lists, nested in votes) renders
+        through here, so keep it in step with Meta.fields.
+        """
+        to_datetime = _DATETIME_FIELD.to_representation
+        return {
+            'user_id': str(instance.user_id),
+            'first_name': instance.first_name,
+            'last_name': instance.last_name,
+            'full_name': instance.full_name,
+            'email': instance.email,
+            'username': instance.username,
+            'date_joined': to_datetime(instance.date_joined),
+            'updated_at': to_datetime(instance.updated_at),
+        }
+
+
+# Unbound DateTimeField used only for its output formatting
+_DATETIME_FIELD = serializers.DateTimeField()
+
+
+class UserListSerializer(UserSerializer):
+    """
+    UserSerializer for the read-only user list endpoints, which load only
+    the columns a row renders.
+    """
+    only_fields = ('user_id', 'first_name', 'last_name', 'email', 'username', 'date_joined', 'updated_at')
+
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Select only the columns a row reads, leaving out the password hash"""
+        return queryset.only(*cls.only_fields)
 
-class UserUpdateSerializer(serializers.ModelSerializer):
+
+class UserUpdateSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     """
     User Profile Update Serializer
     
     Updates user profile information.
-    Validates email uniqueness and ownership permissions.
+    Validates email/username uniqueness.
     
     Example request:
     ```json
@@ -274,49 +347,11 @@ class UserUpdateSerializer(serializers.ModelSerializer):
         model = User
         fields = ('username', 'first_name', 'last_name', 'email')
     
-    def validate_email(self, value):
-        """
-        Validate email uniqueness (excluding current user)
-        
-        Args:
-            value (str): Email address to validate
-            
-        Returns:
-            str: Validated email address
-            
-        Raises:
-            ValidationError: If email is already in use by another user
-        """
-        user = self.instance
-        if User.objects.exclude(pk=user.pk).filter(email=value).exists():
-            raise serializers.ValidationError(
-                "This email address is already registered to another account"
-            )
-        return value
-    
-    def validate_username(self, value):
-        """
-        Validate username uniqueness (excluding current user)
-        
-        Args:
-            value (str): Username to validate
-            
-        Returns:
-            str: Validated username
-            
-        Raises:
-            ValidationError: If username is already taken
-        """
-        user = self.instance
-        if User.objects.exclude(pk=user.pk).filter(username=value).exists():
-            raise serializers.ValidationError(
-                "This username is already taken"
-            )
-        return value
-
     def validate(self, attrs):
         """
-        Validate that user can only update their own profile
+        Validate that a new email or username is not used by another account.
+        Ownership is enforced by the view (UserViewSet's IsSelf permission;
+        update_profile always edits request.user).
         
         Args:
             attrs (dict): Dictionary containing update data
@@ -325,15 +360,43 @@ class UserUpdateSerializer(serializers.ModelSerializer):
             dict: Validated data
             
         Raises:
-            ValidationError: If user tries to update another user's profile
+            ValidationError: If the email or username is already in use
         """
-        request_user = self.context.get('request').user
-        if request_user != self.instance:
-            raise serializers.ValidationError({
-                'non_field_errors': ['You can only update your own profile']
-            })
+        self._check_unique(attrs.get('email'), attrs.get('username'))
         return attrs
 
+    def update(self, instance, validated_data):
+        """
+        Write only the fields whose values changed; a PATCH that changes
+        nothing issues no UPDATE and fires no post_save.
+        """
+        changed = [name for name, value in validated_data.items() if getattr(instance, name) != value]
+        if not changed:
+            return instance
+        for name in changed:
+            setattr(instance, name, validated_data[name])
+        instance.save(update_fields=[*changed, 'updated_at'])
+        return instance
+
+    def _check_unique(self, email, username):
+        """Check email and username against other accounts with one query"""
+        q = Q()
+        if email is not None:
+            q |= Q(email=email)
+        if username is not None:
+            q |= Q(username=username)
+        if not q:
+            return
+        errors = {}
+        taken = User.objects.exclude(pk=self.instance.pk).filter(q).values_list('email', 'username')
+        for taken_email, taken_username in taken:
+            if email is not None and taken_email == email:
+                errors['email'] = ["This email address is already registered to another account"]
+            if username is not None and taken_username == username:
+                errors['username'] = ["This username is already taken"]
+        if errors:
+            raise serializers.ValidationError(errors)
+
 class ChangePasswordSerializer(serializers.Serializer):
     """
     Password Change Serializer
@@ -461,6 +524,14 @@ class UserProfileUpdateResponseSerializer(serializers.Serializer):
     user = UserSerializer(help_text="Updated user data")
 
 
+class PaginatedUserResponseSerializer(serializers.Serializer):
+    """Response serializer for the paginated all_users endpoint"""
+    count = serializers.IntegerField(help_text="Total number of users")
+    next = serializers.URLField(allow_null=True, help_text="URL of the next page")
+    previous = serializers.URLField(allow_null=True, help_text="URL of the previous page")
+    results = UserSerializer(many=True, help_text="Users on this page")
+
+
 class PasswordChangeResponseSerializer(serializers.Serializer):
     """Response serializer for password change endpoint"""
     message = serializers.CharField(help_text="Success message")
@@ -0,0 +1,28 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from .cache import invalidate_token_cache, invalidate_user_cache
+from .models import User
+
+
+@receiver([post_save, post_delete], sender=User)
+def invalidate_user(sender, instance, **kwargs):
+    invalidate_user_cache(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def invalidate_user_token(sender, instance, created, update_fields=None, **kwargs):
+    # The cached credentials carry the user: drop them so deactivation and
+    # profile edits are seen at once. Login's last_login write changes
+    # nothing a request reads, and a new user has no token yet.
+    if created or (update_fields is not None and set(update_fields) <= {'last_login'}):
+        return
+    key = Token.objects.filter(user_id=instance.pk).values_list('key', flat=True).first()
+    if key is not None:
+        invalidate_token_cache(key)
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    invalidate_token_cache(instance.key)
@@ -1,25 +1,25 @@
+import uuid
+
 from django.shortcuts import render
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
-from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser
+from rest_framework.permissions import IsAuthenticated, AllowAny, IsAdminUser, BasePermission
 from rest_framework.authtoken.models import Token
 from rest_framework.views import APIView
-from drf_yasg.utils import swagger_auto_schema
-from drf_yasg import openapi
 from django.contrib.auth import login, logout
+from django.db import transaction
+from django.db.models import F
+from votes.models import Vote
+from .cache import get_or_build, invalidate_user_cache
 from .models import User
 from .serializers import (
     UserSerializer,
+    UserListSerializer,
     UserRegistrationSerializer,
     UserLoginSerializer,
     UserUpdateSerializer,
-    ChangePasswordSerializer,
-    UserRegistrationResponseSerializer,
-    UserLoginResponseSerializer,
-    UserProfileUpdateResponseSerializer,
-    PasswordChangeResponseSerializer,
-    ErrorResponseSerializer
+    ChangePasswordSerializer
 )
 
 
@@ -45,64 +45,15 @@ class UserRegistrationView(APIView):
     """
     permission_classes = [AllowAny]
 
-    @swagger_auto_schema(
-        operation_id="register_user",
-        operation_summary="Register New User Account",
-        operation_description="""
-        Register a new user account with email verification.
-        
-        **Password Requirements:**
-        - Minimum 8 characters
-        - Mix of letters, numbers, and special characters
-        - Cannot be too similar to personal information
-        - Cannot be a commonly used password
-        
-        **Returns:**
-        - User profile data
-        - Authentication token for immediate login
-        """,
-        request_body=UserRegistrationSerializer,
-        responses={
-            201: openapi.Response(
-                description="User registered successfully",
-                schema=UserRegistrationResponseSerializer,
-                examples={
-                    "application/json": {
-                        "message": "User registered successfully",
-                        "user": {
-                            "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                            "first_name": "John",
-                            "last_name": "Doe",
-                            "email": "john.doe@example.com",
-                            "username": "johndoe",
-                            "full_name": "John Doe",
-                            "date_joined": "2024-01-15T10:30:00Z"
-                        },
-                        "token": "9944b09199c62bcf9418ad846dd0e4bbdfc6ee4b"
-                    }
-                }
-            ),
-            400: openapi.Response(
-                description="Validation error",
-                schema=ErrorResponseSerializer,
-                examples={
-                    "application/json": {
-                        "email": ["User with this email already exists."],
-                        "username": ["This username is already taken."],
-                        "password": ["This password is too weak."],
-                        "password_confirm": ["Passwords don't match."]
-                    }
-                }
-            )
-        },
-        tags=['Authentication']
-    )
     def post(self, request):
         """Register a new user account"""
         serializer = UserRegistrationSerializer(data=request.data)
         if serializer.is_valid():
-            user = serializer.save()
-            token, created = Token.objects.get_or_create(user=user)
+            # One commit for both rows: no account is left without a token
+            with transaction.atomic():
+                user = serializer.save()
+                # A brand-new user cannot have a token yet
+                token = Token.objects.create(user=user)
             return Response({
                 'message': 'User registered successfully',
                 'user': UserSerializer(user).data,
@@ -126,55 +77,6 @@ class UserLoginView(APIView):
     """
     permission_classes = [AllowAny]
 
-    @swagger_auto_schema(
-        operation_id="login_user",
-        operation_summary="User Login",
-        operation_description="""
-        Authenticate user with email and password credentials.
-        
-        **Authentication Process:**
-        1. Validates email format
-        2. Checks if user exists and is active
-        3. Verifies password hash
-        4. Generates/retrieves authentication token
-        5. Creates login session
-        
-        **Returns:**
-        - User profile information
-        - Authentication token for API requests
-        """,
-        request_body=UserLoginSerializer,
-        responses={
-            200: openapi.Response(
-                description="Login successful",
-                schema=UserLoginResponseSerializer,
-                examples={
-                    "application/json": {
-                        "message": "Login successful",
-                        "user": {
-                            "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                            "first_name": "John",
-                            "last_name": "Doe", 
-                            "email": "john.doe@example.com",
-                            "username": "johndoe",
-                            "full_name": "John Doe"
-                        },
-                        "token": "9944b09199c62bcf9418ad846dd0e4bbdfc6ee4b"
-                    }
-                }
-            ),
-            400: openapi.Response(
-                description="Invalid credentials",
-                schema=ErrorResponseSerializer,
-                examples={
-                    "application/json": {
-                        "non_field_errors": ["Invalid email or password"]
-                    }
-                }
-            )
-        },
-        tags=['Authentication']
-    )
     def post(self, request):
         """Authenticate user login"""
         serializer = UserLoginSerializer(data=request.data)
@@ -203,64 +105,21 @@ class UserLogoutView(APIView):
     """
     permission_classes = [IsAuthenticated]
 
-    @swagger_auto_schema(
-        operation_id="logout_user",
-        operation_summary="User Logout",
-        operation_description="""
-        Logout the current authenticated user.
-        
-        **Process:**
-        1. Validates authentication token
-        2. Deletes user's authentication token
-        3. Clears login session
-        4. Invalidates API access
-        
-        **Security:**
-        - Prevents token reuse
-        - Clears server-side session data
-        - Requires valid token to logout
-        """,
-        manual_parameters=[
-            openapi.Parameter(
-                'Authorization',
-                openapi.IN_HEADER,
-                description="Token your_auth_token",
-                type=openapi.TYPE_STRING,
-                required=True
-            )
-        ],
-        responses={
-            200: openapi.Response(
-                description="Logout successful",
-                examples={
-                    "application/json": {
-                        "message": "Logout successful"
-                    }
-                }
-            ),
-            400: openapi.Response(
-                description="Logout failed",
-                examples={
-                    "application/json": {
-                        "error": "Something went wrong"
-                    }
-                }
-            ),
-            401: "Authentication required"
-        },
-        tags=['Authentication']
-    )
     def post(self, request):
         """Logout current user"""
-        try:
-            request.user.auth_token.delete()
-            return Response({
-                'message': 'Logout successful'
-            }, status=status.HTTP_200_OK)
-        except Exception as e:
-            return Response({
-                'error': 'Something went wrong during logout'
-            }, status=status.HTTP_400_BAD_REQUEST)
+        # The token's post_delete receiver drops its cached credentials
+        Token.objects.filter(user_id=request.user.pk).delete()
+        return Response({
+            'message': 'Logout successful'
+        }, status=status.HTTP_200_OK)
+
+
+class IsSelf(BasePermission):
+    """
+    Only allow users to modify their own account.
+    """
+    def has_object_permission(self, request, view, obj):
+        return obj.pk == request.user.pk
 
 
 class UserViewSet(viewsets.ModelViewSet):
@@ -291,13 +150,19 @@ class UserViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """Filter queryset based on user permissions"""
         if self.request.user.is_staff:
-            return User.objects.all()
-        return User.objects.filter(user_id=self.request.user.user_id)
+            queryset = User.objects.all()
+        else:
+            queryset = User.objects.filter(user_id=self.request.user.user_id)
+        if self.action == 'list':
+            queryset = UserListSerializer.setup_eager_loading(queryset)
+        return queryset
     
     def get_permissions(self):
         """Set permissions based on action"""
         if self.action in ['list', 'all_users', 'delete_user']:
             permission_classes = [IsAdminUser]
+        elif self.action in ['update', 'partial_update']:
+            permission_classes = [IsAuthenticated, IsSelf]
         else:
             permission_classes = [IsAuthenticated]
         return [permission() for permission in permission_classes]
@@ -306,99 +171,26 @@ class UserViewSet(viewsets.ModelViewSet):
         """Return appropriate serializer based on action"""
         if self.action in ['update', 'partial_update']:
             return UserUpdateSerializer
+        if self.action == 'list':
+            return UserListSerializer
         return UserSerializer
 
-    @swagger_auto_schema(
-        operation_id="get_user_profile",
-        operation_summary="Get Current User Profile",
-        operation_description="""
-        Retrieve the authenticated user's complete profile information.
-        
-        **Returns:**
-        - Complete user profile data
-        - Read-only computed fields (full_name, etc.)
-        - Account timestamps
-        """,
-        responses={
-            200: openapi.Response(
-                description="Profile retrieved successfully",
-                schema=UserSerializer
-            ),
-            401: "Authentication required"
-        },
-        tags=['User Profile']
-    )
+    def retrieve(self, request, *args, **kwargs):
+        """Serve a user's details from the cache once permission is settled"""
+        try:
+            user_id = uuid.UUID(str(kwargs['pk']))
+        except ValueError:
+            return super().retrieve(request, *args, **kwargs)
+        if not (request.user.is_staff or user_id == request.user.pk):
+            # get_queryset hides other users from non-staff: a 404, never cached
+            return super().retrieve(request, *args, **kwargs)
+        return Response(get_or_build(user_id, lambda: self.get_serializer(self.get_object()).data))
+
     @action(detail=False, methods=['get'])
     def profile(self, request):
         """Get current user's profile information"""
-        serializer = UserSerializer(request.user)
-        return Response(serializer.data)
+        return Response(get_or_build(request.user.pk, lambda: UserSerializer(request.user).data))
 
-    @swagger_auto_schema(
-        method='put',
-        operation_id="update_user_profile_put",
-        operation_summary="Update User Profile (Complete)",
-        operation_description="Update all user profile fields (PUT method)",
-        request_body=UserUpdateSerializer,
-        responses={
-            200: openapi.Response(
-                description="Profile updated successfully",
-                schema=UserProfileUpdateResponseSerializer
-            ),
-            400: "Validation error"
-        },
-        tags=['User Profile']
-    )
-    @swagger_auto_schema(
-        method='patch',
-        operation_id="update_user_profile_patch",
-        operation_summary="Update User Profile (Partial)",
-        operation_description="""
-        Partially update user profile information (PATCH method).
-        
-        **Features:**
-        - Update only specified fields
-        - Email uniqueness validation
-        - Username uniqueness validation
-        - Permission validation (own profile only)
-        
-        **Updatable Fields:**
-        - first_name
-        - last_name
-        - email (must be unique)
-        - username (must be unique)
-        """,
-        request_body=UserUpdateSerializer,
-        responses={
-            200: openapi.Response(
-                description="Profile updated successfully",
-                schema=UserProfileUpdateResponseSerializer,
-                examples={
-                    "application/json": {
-                        "message": "Profile updated successfully",
-                        "user": {
-                            "user_id": "123e4567-e89b-12d3-a456-426614174000",
-                            "first_name": "John Updated",
-                            "last_name": "Doe Updated",
-                            "email": "john.updated@example.com",
-                            "username": "johndoe_updated"
-                        }
-                    }
-                }
-            ),
-            400: openapi.Response(
-                description="Validation error",
-                examples={
-                    "application/json": {
-                        "email": ["This email address is already registered"],
-                        "username": ["This username is already taken"]
-                    }
-                }
-            ),
-            403: "Permission denied - Can only update own profile"
-        },
-        tags=['User Profile']
-    )
     @action(detail=False, methods=['put', 'patch'])
     def update_profile(self, request):
         """
@@ -418,49 +210,6 @@ class UserViewSet(viewsets.ModelViewSet):
             })
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    @swagger_auto_schema(
-        operation_id="change_user_password",
-        operation_summary="Change User Password",
-        operation_description="""
-        Change the authenticated user's password.
-        
-        **Security Requirements:**
-        - Current password verification
-        - New password strength validation
-        - Password confirmation matching
-        - Automatic token refresh
-        
-        **Process:**
-        1. Validates current password
-        2. Checks new password strength
-        3. Confirms password match
-        4. Updates password hash
-        5. Maintains current login session
-        """,
-        request_body=ChangePasswordSerializer,
-        responses={
-            200: openapi.Response(
-                description="Password changed successfully",
-                schema=PasswordChangeResponseSerializer,
-                examples={
-                    "application/json": {
-                        "message": "Password changed successfully"
-                    }
-                }
-            ),
-            400: openapi.Response(
-                description="Validation error",
-                examples={
-                    "application/json": {
-                        "old_password": ["Current password is incorrect"],
-                        "confirm_password": ["New passwords don't match"],
-                        "new_password": ["This password is too weak"]
-                    }
-                }
-            )
-        },
-        tags=['User Profile']
-    )
     @action(detail=False, methods=["post"])
     def change_password(self, request):
         """Change current user's password"""
@@ -475,177 +224,51 @@ class UserViewSet(viewsets.ModelViewSet):
             }, status=status.HTTP_200_OK)
         return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    @swagger_auto_schema(
-        operation_id="deactivate_user_account",
-        operation_summary="Deactivate User Account",
-        operation_description="""
-        Deactivate the current user's account (soft delete).
-        
-        **Process:**
-        - Sets is_active = False
-        - Preserves user data for potential reactivation
-        - Prevents future logins
-        - Maintains data integrity
-        
-        **Note:** This is a soft delete. Account can be reactivated by admin.
-        """,
-        responses={
-            200: openapi.Response(
-                description="Account deactivated successfully",
-                examples={
-                    "application/json": {
-                        "message": "Account deactivated successfully"
-                    }
-                }
-            )
-        },
-        tags=['User Profile']
-    )
     @action(detail=False, methods=['delete'])
     def deactivate_account(self, request):
         """Deactivate current user's account"""
-        user = request.user
-        user.is_active = False
-        user.save(update_fields=['is_active'])
+        # A single UPDATE skips post_save, so clear the cached profile here;
+        # deleting the token also drops its cached credentials (users.signals)
+        User.objects.filter(pk=request.user.pk).update(is_active=False)
+        invalidate_user_cache(request.user.pk)
+        Token.objects.filter(user_id=request.user.pk).delete()
         return Response({
             'message': 'Account deactivated successfully'
         }, status=status.HTTP_200_OK)
 
-    @swagger_auto_schema(
-        operation_id="get_voting_history",
-        operation_summary="Get User's Voting History",
-        operation_description="""
-        Retrieve complete voting history for the authenticated user.
-        
-        **Returns:**
-        - List of all votes cast by user
-        - Poll information for each vote
-        - Option details and timestamps
-        - Sorted by most recent first
-        """,
-        responses={
-            200: openapi.Response(
-                description="Voting history retrieved",
-                examples={
-                    "application/json": [
-                        {
-                            "vote_id": "vote-uuid",
-                            "poll": {
-                                "poll_id": "poll-uuid",
-                                "title": "Best Programming Language"
-                            },
-                            "option": {
-                                "option_id": "option-uuid", 
-                                "option_text": "Python"
-                            },
-                            "timestamp": "2024-01-15T14:30:00Z"
-                        }
-                    ]
-                }
-            )
-        },
-        tags=['User Profile']
-    )
     @action(detail=False, methods=['get'])
     def voting_history(self, request):
         """Get current user's voting history"""
-        try:
-            from votes.models import Vote
-            from votes.serializers import VoteSerializer
-            votes = Vote.objects.filter(user=request.user).select_related(
-                'poll', 'option'
-            ).order_by('-timestamp')
-            serializer = VoteSerializer(votes, many=True)
-            return Response(serializer.data)
-        except ImportError:
-            return Response({
-                'message': 'No voting history available'
-            })
+        # Plain dict rows in VoteListSerializer's shape; the JSON renderer
+        # handles the UUID/datetime values, so no Vote instances are built
+        votes = Vote.objects.filter(user_id=request.user.pk).order_by('-timestamp').values(
+            'vote_id', 'poll_id', 'option_id', 'timestamp',
+            poll_title=F('poll__title'), option_text=F('option__option_text'),
+        )
+        page = self.paginate_queryset(votes)
+        for row in page:
+            row['user_username'] = request.user.username
+        return self.get_paginated_response(page)
 
-    @swagger_auto_schema(
-        operation_id="list_all_users",
-        operation_summary="List All Users (Admin Only)",
-        operation_description="""
-        Retrieve list of all users in the system.
-        
-        **Admin Only:** Requires staff permissions.
-        
-        **Returns:**
-        - Complete list of all users
-        - Full profile information
-        - Account status and timestamps
-        """,
-        responses={
-            200: openapi.Response(
-                description="Users retrieved successfully",
-                schema=UserSerializer(many=True)
-            ),
-            403: "Admin access required"
-        },
-        tags=['Admin Operations']
-    )
     @action(detail=False, methods=['get'], permission_classes=[IsAdminUser])
     def all_users(self, request):
         """Get all users - Admin only"""
-        users = User.objects.all().order_by('-date_joined')
-        serializer = UserSerializer(users, many=True)
-        return Response(serializer.data)
+        users = UserListSerializer.setup_eager_loading(User.objects.all()).order_by('-date_joined')
+        page = self.paginate_queryset(users)
+        return self.get_paginated_response(UserListSerializer(page, many=True).data)
 
-    @swagger_auto_schema(
-        operation_id="delete_user_by_id",
-        operation_summary="Delete User by ID (Admin Only)",
-        operation_description="""
-        Permanently delete a user account by ID.
-        
-        **Admin Only:** Requires staff permissions.
-        **Warning:** This is a permanent deletion.
-        
-        **Process:**
-        1. Validates user existence
-        2. Performs hard delete
-        3. Removes all related data
-        4. Cannot be undone
-        """,
-        manual_parameters=[
-            openapi.Parameter(
-                'pk',
-                openapi.IN_PATH,
-                description="User ID (UUID)",
-                type=openapi.TYPE_STRING,
-                required=True
-            )
-        ],
-        responses={
-            200: openapi.Response(
-                description="User deleted successfully",
-                examples={
-                    "application/json": {
-                        "message": "User deleted successfully"
-                    }
-                }
-            ),
-            404: openapi.Response(
-                description="User not found",
-                examples={
-                    "application/json": {
-                        "error": "User not found"
-                    }
-                }
-            ),
-            403: "Admin access required"
-        },
-        tags=['Admin Operations']
-    )
     @action(detail=True, methods=['delete'], permission_classes=[IsAdminUser])
     def delete_user(self, request, pk=None):
         """Delete a user by ID - Admin only"""
         try:
-            user = User.objects.get(pk=pk)
-            user.delete()
-            return Response({
-                'message': 'User deleted successfully'
-            }, status=status.HTTP_200_OK)
-        except User.DoesNotExist:
+            deleted, _ = User.objects.filter(pk=uuid.UUID(str(pk))).delete()
+        except ValueError:
+            # Not a UUID, so no user can match
+            deleted = 0
+        if not deleted:
             return Response({
                 'error': 'User not found'
-            }, status=status.HTTP_404_NOT_FOUND)
\ No newline at end of file
+            }, status=status.HTTP_404_NOT_FOUND)
+        return Response({
+            'message': 'User deleted successfully'
+        }, status=status.HTTP_200_OK)
\ No newline at end of file
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-15 22:04
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0003_option_text_length_check'),
+        ('votes', '0002_alter_vote_option_alter_vote_poll_alter_vote_user'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterUniqueTogether(
+            name='vote',
+            unique_together=set(),
+        ),
+        migrations.AddConstraint(
+            model_name='vote',
+            constraint=models.UniqueConstraint(fields=('poll', 'user'), name='uniq_vote_per_poll_user'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-15 23:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('polls', '0007_poll_never_expires_index'),
+        ('votes', '0003_vote_unique_constraint'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='vote',
+            index=models.Index(fields=['user', '-timestamp'], name='votes_vote_user_id_ec4f58_idx'),
+        ),
+    ]
@@ -12,8 +12,15 @@ class Vote(models.Model):
     timestamp = models.DateTimeField(auto_now_add=True)
 
     class Meta:
-        unique_together = ('poll', 'user')
+        constraints = [
+            models.UniqueConstraint(fields=['poll', 'user'], name='uniq_vote_per_poll_user'),
+        ]
         ordering = ['-timestamp']
+        indexes = [
+            # A user's votes newest first (voting_history, /votes/); the
+            # unique constraint already indexes (poll, user)
+            models.Index(fields=['user', '-timestamp']),
+        ]
 
     def __str__(self):
         return f"Vote by {self.user.username} with email {self.user.email} for {self.option} in {self.poll}"
@@ -1,9 +1,12 @@
+from django.db.models import Count, Prefetch
 from rest_framework import serializers
 from .models import Vote
+from polls.models import Poll, Option
+from onlinepollsystem.serializers import CachedFieldsMixin
 from polls.serializers import PollSerializer, OptionSerializer
-from users.serializers import UserSerializer
+from users.serializers import UserListSerializer, UserSerializer
 
-class VoteSerializer(serializers.ModelSerializer):
+class VoteSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     poll = PollSerializer(read_only=True)
     option = OptionSerializer(read_only=True)
     user = UserSerializer(read_only=True)
@@ -17,4 +20,44 @@ class VoteSerializer(serializers.ModelSerializer):
         model = Vote
         fields = ['vote_id', 'poll', 'poll_title', 'option', 'option_text', 
                  'user', 'user_username', 'timestamp']
-        read_only_fields = ['vote_id', 'timestamp']
\ No newline at end of file
+        read_only_fields = ['vote_id', 'timestamp']
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """
+        The nested poll and option serializers read vote totals and options;
+        load those in bulk so a list of votes costs a fixed number of queries.
+        The joined user row is trimmed to the columns UserSerializer renders.
+        """
+        user_fields = ['user__' + name for name in UserListSerializer.only_fields]
+        return queryset.select_related('user').only(
+            'vote_id', 'poll', 'option', 'timestamp', *user_fields
+        ).prefetch_related(
+            Prefetch('poll', queryset=PollSerializer.setup_eager_loading(Poll.objects.all())),
+            Prefetch('option', queryset=Option.objects.annotate(vote_count=Count('votes'))),
+        )
+
+
+class VoteListSerializer(CachedFieldsMixin, serializers.ModelSerializer):
+    """
+    Flat vote rows for list endpoints; the nested VoteSerializer is kept
+    for the detail view.
+    """
+    poll_id = serializers.UUIDField(read_only=True)
+    poll_title = serializers.CharField(source='poll.title', read_only=True)
+    option_id = serializers.UUIDField(read_only=True)
+    option_text = serializers.CharField(source='option.option_text', read_only=True)
+    user_username = serializers.CharField(source='user.username', read_only=True)
+
+    class Meta:
+        model = Vote
+        fields = ['vote_id', 'poll_id', 'poll_title', 'option_id', 'option_text',
+                  'user_username', 'timestamp']
+        read_only_fields = fields
+
+    @staticmethod
+    def setup_eager_loading(queryset):
+        """Join the three related rows, reading only the columns shown"""
+        return queryset.select_related('poll', 'option', 'user').only(
+            'vote_id', 'timestamp', 'poll__title', 'option__option_text', 'user__username'
+        )
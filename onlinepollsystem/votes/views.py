@@ -4,7 +4,7 @@ from django.shortcuts import render
 from rest_framework import viewsets
 from rest_framework.permissions import IsAuthenticated
 from .models import Vote
-from .serializers import VoteSerializer
+from .serializers import VoteListSerializer, VoteSerializer
 
 class VoteViewSet(viewsets.ReadOnlyModelViewSet):
     """ViewSet for viewing user's votes"""
@@ -12,4 +12,11 @@ class VoteViewSet(viewsets.ReadOnlyModelViewSet):
     permission_classes = [IsAuthenticated]
     
     def get_queryset(self):
-        return Vote.objects.filter(user=self.request.user).select_related('poll', 'option', 'user')
\ No newline at end of file
+        return self.get_serializer_class().setup_eager_loading(
+            Vote.objects.filter(user=self.request.user)
+        )
+
+    def get_serializer_class(self):
+        if self.action == 'list':
+            return VoteListSerializer
+        return VoteSerializer